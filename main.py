@@ -7,9 +7,298 @@ Launches eye tracking and voice control as separate processes
 import sys
 import subprocess
 import tkinter as tk
-from tkinter import ttk, scrolledtext
-from datetime import datetime
+from tkinter import ttk
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
 import os
+import queue
+import threading
+import time
+
+
+# Printed once when the control panel starts
+_BANNER = (
+    "\n" + "=" * 60 + "\n"
+    "BlinkOS - Hands-Free Computer Control System\n"
+    + "=" * 60 + "\n"
+    "\nControl Panel launched!\n"
+    "Use the GUI to control the system\n\n"
+)
+
+# Reference text for the Commands / Help / Demo windows
+COMMANDS_TEXT = """
+* APPLICATIONS (9 commands):
+  • open safari / chrome / firefox
+  • open notes / terminal / mail
+  • open finder / messages / calendar
+
+* WINDOW MANAGEMENT (10 commands):
+  • close window / close tab
+  • new tab / new window
+  • minimize / maximize / full screen
+  • next window / previous window
+  • quit app
+
+* NAVIGATION (10 commands):
+  • scroll down / scroll up
+  • page down / page up
+  • go back / go forward
+  • refresh / reload
+
+* TAB MANAGEMENT (3 commands):
+  • next tab / previous tab
+  • reopen tab
+
+* SYSTEM CONTROLS (8 commands):
+  • volume up / volume down / mute / unmute
+  • brightness up / brightness down
+  • take screenshot / screen shot
+  • sleep
+
+* DICTATION (2 commands):
+  • type / start typing (then speak text)
+  • stop typing (exit dictation mode)
+
+* SEARCH (2 commands):
+  • search [your query]
+  • google [your query]
+
+* SPECIAL (2 commands):
+  • help / list commands
+  • exit / quit voice / stop listening
+
+TOTAL: 46+ Commands Available!
+"""
+
+HELP_TEXT = """
+GETTING STARTED:
+================
+
+1. Click "Start Both Systems" for full control
+   OR start them individually
+
+2. Eye Tracking Window:
+   - Move your HEAD to control cursor
+   - BLINK to click
+   - Press 'Q' to quit
+   - Press 'K' to toggle clicking
+   - Press '+/-' to adjust sensitivity
+
+3. Voice Control:
+   - Say commands clearly
+   - Wait for "Listening..." prompt
+   - Say "help" to list all commands
+   - Say "exit" to quit
+
+BEST PRACTICES:
+===============
+
+Eye Tracking:
+  ✓ Sit ~50cm from camera
+  ✓ Good front lighting (no backlighting)
+  ✓ Keep head movements smooth
+  ✓ Blink deliberately for clicks
+
+Voice Control:
+  ✓ Speak clearly and at normal volume
+  ✓ Wait for recognition before next command
+  ✓ Use exact command phrases
+  ✓ Say "type" to enter dictation mode
+
+DEMO SCENARIOS:
+===============
+
+Scenario 1: Web Browsing
+  1. Say "open safari"
+  2. Move head to address bar, blink
+  3. Say "search artificial intelligence"
+  4. Say "scroll down"
+
+Scenario 2: Document Creation
+  1. Say "open notes"
+  2. Say "new window"
+  3. Say "type"
+  4. Speak your text
+  5. Say "stop typing"
+
+Scenario 3: System Control
+  1. Say "volume up"
+  2. Say "brightness down"
+  3. Say "take screenshot"
+  4. Say "minimize"
+
+TROUBLESHOOTING:
+================
+
+Eye tracking not working:
+  → Check camera permissions
+  → Improve lighting
+  → Adjust sensitivity with +/-
+
+Voice not recognized:
+  → Speak louder/clearer
+  → Check microphone permissions
+  → Reduce background noise
+
+System slow:
+  → Close other applications
+  → Restart BlinkOS
+  → Check CPU usage
+
+For more help, see README.md
+"""
+
+DEMO_TEXT = """
+DEMO SCENARIO 1: Web Research (2 min)
+========================================
+
+Goal: Search for information hands-free
+
+Steps:
+1. Voice: "open safari"
+2. Head: Move cursor to address bar
+3. Blink: Click address bar
+4. Voice: "search machine learning basics"
+5. Head + Blink: Click first result
+6. Voice: "scroll down"
+7. Voice: "scroll down"
+8. Voice: "go back"
+9. Voice: "close tab"
+
+Impact: Shows seamless browsing without hands!
+
+
+DEMO SCENARIO 2: Document Creation (2 min)
+==============================================
+
+Goal: Create and edit a document
+
+Steps:
+1. Voice: "open notes"
+2. Voice: "new window"
+3. Voice: "type"
+4. Voice: "Dear Team comma I am excited to present 
+   BlinkOS comma a hands free computer control 
+   system period New paragraph This system uses 
+   eye tracking and voice recognition period"
+5. Voice: "stop typing"
+6. Head + Blink: Select text (optional)
+7. Voice: "close window"
+
+Impact: Shows accessibility for typing!
+
+
+DEMO SCENARIO 3: System Control (1.5 min)
+============================================
+
+Goal: Control system without touching anything
+
+Steps:
+1. Voice: "open finder"
+2. Head + Blink: Navigate folders
+3. Voice: "volume up"
+4. Voice: "brightness down"
+5. Voice: "take screenshot"
+6. Voice: "minimize"
+7. Voice: "open terminal"
+8. Voice: "quit app"
+
+Impact: Shows system-wide control!
+
+
+DEMO SCENARIO 4: Multi-App Workflow (2.5 min)
+================================================
+
+Goal: Complete workflow across multiple apps
+
+Steps:
+1. Voice: "open safari"
+2. Voice: "search github"
+3. Head + Blink: Click GitHub
+4. Voice: "open notes"
+5. Voice: "type"
+6. Voice: "GitHub is a platform for... (description)"
+7. Voice: "stop typing"
+8. Voice: "next window" (back to Safari)
+9. Voice: "scroll down"
+10. Voice: "previous window" (back to Notes)
+11. Voice: "close window"
+
+Impact: Shows real-world usage!
+
+
+PRESENTATION TIPS:
+==================
+
+✓ Start with problem statement (accessibility)
+✓ Show live demo (2-3 scenarios)
+✓ Have backup video ready
+✓ Explain technology briefly
+✓ Emphasize impact on users
+✓ Practice transitions between scenarios
+✓ Time yourself (< 5 minutes total)
+"""
+
+
+# Button styles shared by every ttk.Button: name -> (background, pressed background)
+BUTTON_STYLES = {
+    'Primary': ("#3498db", "#114e77"),
+    'Success': ("#2ecc71", "#1e8449"),
+    'Danger': ("#e74c3c", "#a93226"),
+    'Warning': ("#e67e22", "#a04000"),
+    'Neutral': ("#95a5a6", "#616a6b"),
+    'Accent': ("#9b59b6", "#6c3483"),
+}
+
+
+# Layout for each reference window, keyed as used by _show_reference
+REFERENCE_WINDOWS = {
+    'commands': {
+        'title': "Voice Commands Reference",
+        'geometry': "550x650",
+        'heading': "Voice Commands",
+        'width': 65, 'height': 32,
+        'font': ("Courier", 10),
+        'button_style': "Small.Neutral.TButton",
+        'text': COMMANDS_TEXT,
+    },
+    'help': {
+        'title': "BlinkOS Help",
+        'geometry': "500x600",
+        'heading': "How to Use BlinkOS",
+        'width': 60, 'height': 28,
+        'font': ("Arial", 10),
+        'button_style': "Small.Primary.TButton",
+        'text': HELP_TEXT,
+    },
+    'demo': {
+        'title': "Demo Scenarios",
+        'geometry': "550x600",
+        'heading': "Hackathon Demo Scenarios",
+        'width': 65, 'height': 28,
+        'font': ("Arial", 10),
+        'button_style': "Small.Accent.TButton",
+        'text': DEMO_TEXT,
+    },
+}
+
+
+@dataclass
+class ProcessSlot:
+    """A child process managed from the control panel, plus its widgets and labels"""
+    name: str                  # e.g. "Eye tracking" - used in log/status text
+    script: str
+    button: ttk.Button
+    status_label: tk.Label
+    start_text: str
+    stop_text: str
+    idle_style: str            # Button style while the process is stopped
+    active_message: str
+    active_status: str
+    ended_message: str
+    process: Optional[subprocess.Popen] = None
+    active: bool = False
 
 
 class BlinkOS:
@@ -22,33 +311,63 @@ class BlinkOS:
         """Initialize BlinkOS"""
         print("Initializing BlinkOS...")
         
-        # Process handles
-        self.eye_process = None
-        self.voice_process = None
+        # Interpreter and child script paths, resolved once so launches
+        # don't depend on the current working directory
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        self._py = sys.executable
+        self._eye_script = os.path.join(base_dir, 'modules', 'eye_tracker.py')
+        self._voice_script = os.path.join(base_dir, 'modules', 'voice_controller.py')
+        
+        # Managed child processes, keyed 'eye' / 'voice' (filled in by setup_gui)
+        self.slots = {}
+        
+        # (key, process) pairs posted by watcher threads; Tk calls are only
+        # safe on the main thread, so they are drained by a poll there
+        self._exited_processes = queue.Queue()
+        self.exit_poll_interval = 200  # ms
         
-        # System state
-        self.eye_tracking_active = False
-        self.voice_control_active = False
+        # Widget option changes, applied together on the next idle pass
+        self._ui_pending = {}
+        self._ui_flush_scheduled = False
+        self._ui_applied = {}  # Last options applied per widget, to skip no-op configs
+        
+        # Reference windows, built on first use and reused afterwards
+        self._reference_windows = {}
         
         # Activity log
-        self.activity_log = []
         self.max_log_entries = 100
+        self.activity_log = deque(maxlen=self.max_log_entries)
+        
+        # Pending log entries, written to the widget once per flush tick
+        self._log_buffer = deque()
+        self._log_parts = []
+        self._log_flush_scheduled = False
+        self.log_flush_interval = 100  # ms
+        self.echo_log = True  # Mirror log entries to the terminal
+        self._ts_cache = (0, "")  # (epoch second, "%H:%M:%S" string)
+        self._entries_since_trim = 0  # Entries written to the widget since the last size check
         
         # Setup GUI
         self.setup_gui()
+        self.root.after(self.exit_poll_interval, self._poll_process_exits)
         
-        print("BlinkOS initialized!")
+        # Report missing scripts now rather than on first click
+        for script in (self._eye_script, self._voice_script):
+            if not os.path.isfile(script):
+                self.log_activity(f"Missing script: {script}")
+                self.update_status("Missing module scripts - see activity log", "#e74c3c")
     
     def setup_gui(self):
         """Create the control panel GUI"""
         self.root = tk.Tk()
         self.root.title("BlinkOS - Hands-Free Computer Control")
         self.root.geometry("600x750")
-        self.root.resizable(True, True)
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        self.setup_styles()
+        
         # Main container
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -96,20 +415,13 @@ class BlinkOS:
         )
         self.eye_status_label.grid(row=0, column=0, sticky=tk.W, pady=5)
         
-        self.eye_button = tk.Button(
+        self.eye_button = ttk.Button(
             eye_frame,
             text="Start Eye Tracking",
-            command=self.toggle_eye_tracking,
+            command=lambda: self.toggle('eye'),
             width=25,
-            height=2,
-            bg="#3498db",
-            fg="black",
-            font=("Arial", 11, "bold"),
-            cursor="hand2",
-            relief= tk.RAISED, 
-            bd = 3, 
-            activebackground="#114e77" ,
-            activeforeground="white"
+            style="Primary.TButton",
+            cursor="hand2"
         )
         self.eye_button.grid(row=1, column=0, pady=5)
         
@@ -139,15 +451,12 @@ Opens in separate window"""
         )
         self.voice_status_label.grid(row=0, column=0, sticky=tk.W, pady=5)
         
-        self.voice_button = tk.Button(
+        self.voice_button = ttk.Button(
             voice_frame,
             text="Start Voice Control",
-            command=self.toggle_voice_control,
+            command=lambda: self.toggle('voice'),
             width=25,
-            height=2,
-            bg="#2ecc71",
-            fg="black",
-            font=("Arial", 11, "bold"),
+            style="Success.TButton",
             cursor="hand2"
         )
         self.voice_button.grid(row=1, column=0, pady=5)
@@ -165,20 +474,44 @@ Say 'exit' to quit"""
         )
         self.voice_info_label.grid(row=2, column=0, pady=5)
         
+        self.slots = {
+            'eye': ProcessSlot(
+                name="Eye tracking",
+                script=self._eye_script,
+                button=self.eye_button,
+                status_label=self.eye_status_label,
+                start_text="Start Eye Tracking",
+                stop_text="Stop Eye Tracking",
+                idle_style="Primary.TButton",
+                active_message="Eye tracking active",
+                active_status="Eye tracking running - check separate window",
+                ended_message="Eye tracking window closed",
+            ),
+            'voice': ProcessSlot(
+                name="Voice control",
+                script=self._voice_script,
+                button=self.voice_button,
+                status_label=self.voice_status_label,
+                start_text="Start Voice Control",
+                stop_text="Stop Voice Control",
+                idle_style="Success.TButton",
+                active_message="Voice control active - say commands now!",
+                active_status="Voice control listening",
+                ended_message="Voice control ended",
+            ),
+        }
+        
         # ==================== QUICK START ====================
         quickstart_frame = ttk.LabelFrame(main_frame, text="Quick Start", padding="10")
         quickstart_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=5)
         quickstart_frame.columnconfigure(0, weight=1)
         
-        tk.Button(
+        ttk.Button(
             quickstart_frame,
             text="Start Both Systems",
             command=self.start_both,
             width=25,
-            height=2,
-            bg="#e67e22",
-            fg="black",
-            font=("Arial", 11, "bold"),
+            style="Warning.TButton",
             cursor="hand2"
         ).grid(row=0, column=0, pady=5)
         
@@ -196,34 +529,28 @@ Say 'exit' to quit"""
         actions_inner = tk.Frame(actions_frame)
         actions_inner.grid(row=0, column=0)
         
-        tk.Button(
+        ttk.Button(
             actions_inner,
             text="Commands",
             command=self.show_commands,
             width=12,
-            bg="#95a5a6",
-            fg="black",
-            font=("Arial", 10)
+            style="Small.Neutral.TButton"
         ).grid(row=0, column=0, padx=3, pady=5)
         
-        tk.Button(
+        ttk.Button(
             actions_inner,
             text="ℹHelp",
             command=self.show_help,
             width=12,
-            bg="#3498db",
-            fg="black",
-            font=("Arial", 10)
+            style="Small.Primary.TButton"
         ).grid(row=0, column=1, padx=3, pady=5)
         
-        tk.Button(
+        ttk.Button(
             actions_inner,
             text="Demo",
             command=self.show_demo_scenarios,
             width=12,
-            bg="#9b59b6",
-            fg="black",
-            font=("Arial", 10)
+            style="Small.Accent.TButton"
         ).grid(row=0, column=2, padx=3, pady=5)
         
         # ==================== ACTIVITY LOG ====================
@@ -235,7 +562,8 @@ Say 'exit' to quit"""
         # Configure main_frame row weight for log expansion
         main_frame.rowconfigure(7, weight=1)
         
-        self.log_text = scrolledtext.ScrolledText(
+        # Plain Text + Scrollbar so tkinter.scrolledtext isn't needed at startup
+        self.log_text = tk.Text(
             log_frame,
             height=8,
             width=70,
@@ -245,6 +573,10 @@ Say 'exit' to quit"""
         )
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        log_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.log_text.config(yscrollcommand=log_scrollbar.set)
+        
         # ==================== STATUS BAR ====================
         status_frame = tk.Frame(main_frame, relief=tk.SUNKEN, bd=1)
         status_frame.grid(row=8, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
@@ -263,485 +595,246 @@ Say 'exit' to quit"""
         self.log_activity("TIP: Start both systems for full hands-free control")
         self.log_activity("Ready to begin!")
     
+    def setup_styles(self):
+        """Configure the shared ttk button styles"""
+        style = ttk.Style(self.root)
+        style.configure("TButton", foreground="black", padding=(6, 4))
+        for name, (background, pressed) in BUTTON_STYLES.items():
+            style.configure(f"{name}.TButton", background=background,
+                            font=("Arial", 11, "bold"), padding=(10, 8))
+            style.map(f"{name}.TButton",
+                      background=[('pressed', pressed), ('active', pressed)],
+                      foreground=[('pressed', "white"), ('active', "white")])
+            style.configure(f"Small.{name}.TButton", font=("Arial", 10), padding=(6, 4))
+    
     def log_activity(self, message):
         """Add entry to activity log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        # Format the timestamp at most once per wall-clock second
+        now = int(time.time())
+        if self._ts_cache[0] != now:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        timestamp = self._ts_cache[1]
+        # Entries are kept as (timestamp, message) and only formatted at flush time
+        log_entry = (timestamp, message)
         
         self.activity_log.append(log_entry)
         
-        if len(self.activity_log) > self.max_log_entries:
-            self.activity_log.pop(0)
+        # Batch widget writes - one insert/redraw per flush tick
+        self._log_buffer.append(log_entry)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(self.log_flush_interval, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all buffered log entries to the activity log widget at once"""
+        self._log_flush_scheduled = False
+        if not self._log_buffer:
+            return
+        
+        # Build the whole block with one join; the parts list is reused across flushes
+        parts = self._log_parts
+        for timestamp, message in self._log_buffer:
+            parts += ("[", timestamp, "] ", message, "\n")
+        block = "".join(parts)
+        del parts[:]
+        
+        self._entries_since_trim += len(self._log_buffer)
+        self._log_buffer.clear()
+        
+        self.log_text.insert(tk.END, block)
+        
+        # Trim the widget in one delete, only checking its size once every
+        # max_log_entries entries; it may reach ~3x the limit between checks
+        if self._entries_since_trim > self.max_log_entries:
+            self._entries_since_trim = 0
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > 2 * self.max_log_entries:
+                excess = line_count - self.max_log_entries
+                self.log_text.delete("1.0", f"{excess}.0")
         
-        self.log_text.insert(tk.END, log_entry)
         self.log_text.see(tk.END)
         
-        print(f"{message}")
+        # One write + flush per tick instead of a print per entry
+        if self.echo_log:
+            sys.stdout.write(block)
+            sys.stdout.flush()
     
     def update_status(self, message, color="#2c3e50"):
         """Update status bar"""
-        self.status_label.config(text=message, fg=color)
+        self._queue_config(self.status_label, text=message, fg=color)
     
-    def toggle_eye_tracking(self):
-        """Start/stop eye tracking"""
-        if not self.eye_tracking_active:
-            self.log_activity("Launching eye tracking system...")
-            self.update_status("Starting eye tracker...", "#e67e22")
-            
-            try:
-                # Launch eye tracker as separate process
-                self.eye_process = subprocess.Popen(
-                    [sys.executable, 'modules/eye_tracker.py'],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                
-                self.eye_tracking_active = True
-                self._update_eye_tracking_ui(True)
-                
-                # Monitor process
-                self.root.after(1000, self.check_eye_tracking_status)
-                
-            except Exception as e:
-                self.log_activity(f"Error starting eye tracking: {e}")
-                self.update_status("Error starting eye tracking", "#e74c3c")
-        else:
-            self.stop_eye_tracking()
-    
-    def stop_eye_tracking(self):
-        """Stop eye tracking"""
-        if self.eye_process:
-            self.eye_process.terminate()
-            self.eye_process = None
-        
-        self.eye_tracking_active = False
-        self._update_eye_tracking_ui(False)
-        self.log_activity("Eye tracking stopped")
-        self.update_status("Eye tracking stopped", "#7f8c8d")
+    def _queue_config(self, widget, **options):
+        """Queue widget options; later calls for the same option win"""
+        self._ui_pending.setdefault(widget, {}).update(options)
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after_idle(self._flush_ui)
     
-    def check_eye_tracking_status(self):
-        """Check if eye tracking process is still running"""
-        if self.eye_tracking_active and self.eye_process:
-            if self.eye_process.poll() is not None:
-                # Process ended
-                self.eye_tracking_active = False
-                self._update_eye_tracking_ui(False)
-                self.log_activity("Eye tracking window closed")
-            else:
-                # Still running, check again
-                self.root.after(1000, self.check_eye_tracking_status)
+    def _flush_ui(self):
+        """Apply all queued widget options in a single pass"""
+        self._ui_flush_scheduled = False
+        pending, self._ui_pending = self._ui_pending, {}
+        for widget, options in pending.items():
+            self._set(widget, **options)
     
-    def _update_eye_tracking_ui(self, active):
-        """Update eye tracking UI"""
-        if active:
-            self.eye_status_label.config(text="Active", fg="green")
-            self.eye_button.config(
-                text="Stop Eye Tracking",
-                bg="#e74c3c"
-            )
-            self.log_activity("Eye tracking active")
-            self.update_status("Eye tracking running - check separate window", "#27ae60")
-        else:
-            self.eye_status_label.config(text="● Inactive", fg="red")
-            self.eye_button.config(
-                text="▶ Start Eye Tracking",
-                bg="#3498db"
-            )
+    def _set(self, widget, **options):
+        """Configure only the options whose value actually changed"""
+        applied = self._ui_applied.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if applied.get(k) != v}
+        if changed:
+            widget.config(**changed)
+            applied.update(changed)
     
-    def toggle_voice_control(self):
-        """Start/stop voice control"""
-        if not self.voice_control_active:
-            self.log_activity("Launching voice control system...")
-            self.update_status("Starting voice control...", "#e67e22")
+    def toggle(self, key):
+        """Start/stop the process in slot `key` ('eye' or 'voice')"""
+        slot = self.slots[key]
+        if not slot.active:
+            self.log_activity(f"Launching {slot.name.lower()} system...")
+            self.update_status(f"Starting {slot.name.lower()}...", "#e67e22")
             
             try:
-                # Launch voice controller as separate process
-                self.voice_process = subprocess.Popen(
-                    [sys.executable, 'modules/voice_controller.py'],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
+                # Launch as separate process
+                # Output is discarded - an unread PIPE fills up and blocks the child
+                slot.process = subprocess.Popen(
+                    [self._py, slot.script],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
                 
-                self.voice_control_active = True
-                self._update_voice_control_ui(True)
+                slot.active = True
+                self._update_ui(slot)
                 
-                # Monitor process
-                self.root.after(1000, self.check_voice_control_status)
+                # Monitor process - the watcher sleeps in wait() until it exits
+                threading.Thread(
+                    target=self._watch_process,
+                    args=(key, slot.process),
+                    daemon=True
+                ).start()
                 
             except Exception as e:
-                self.log_activity(f"Error starting voice control: {e}")
-                self.update_status("Error starting voice control", "#e74c3c")
+                self.log_activity(f"Error starting {slot.name.lower()}: {e}")
+                self.update_status(f"Error starting {slot.name.lower()}", "#e74c3c")
         else:
-            self.stop_voice_control()
+            self.stop(key)
     
-    def stop_voice_control(self):
-        """Stop voice control"""
-        if self.voice_process:
-            self.voice_process.terminate()
-            self.voice_process = None
-        
-        self.voice_control_active = False
-        self._update_voice_control_ui(False)
-        self.log_activity("Voice control stopped")
-        self.update_status("Voice control stopped", "#7f8c8d")
+    def stop(self, key):
+        """Stop the process in slot `key`"""
+        slot = self.slots[key]
+        if slot.process:
+            slot.process.terminate()
+            slot.process = None
+        
+        slot.active = False
+        self._update_ui(slot)
+        self.log_activity(f"{slot.name} stopped")
+        self.update_status(f"{slot.name} stopped", "#7f8c8d")
     
-    def check_voice_control_status(self):
-        """Check if voice control process is still running"""
-        if self.voice_control_active and self.voice_process:
-            if self.voice_process.poll() is not None:
-                # Process ended
-                self.voice_control_active = False
-                self._update_voice_control_ui(False)
-                self.log_activity("Voice control ended")
-            else:
-                # Still running, check again
-                self.root.after(1000, self.check_voice_control_status)
+    def _watch_process(self, key, process):
+        """Watcher thread: block until `process` exits, then notify the Tk thread"""
+        process.wait()
+        self._exited_processes.put((key, process))
     
-    def _update_voice_control_ui(self, active):
-        """Update voice control UI"""
-        if active:
-            self.voice_status_label.config(text="● Active", fg="green")
-            self.voice_button.config(
-                text="Stop Voice Control",
-                bg="#e74c3c"
-            )
-            self.log_activity("Voice control active - say commands now!")
-            self.update_status("Voice control listening ", "#27ae60")
+    def _poll_process_exits(self):
+        """Handle processes reported by the watcher threads, then reschedule"""
+        while True:
+            try:
+                key, process = self._exited_processes.get_nowait()
+            except queue.Empty:
+                break
+            self._on_process_exit(key, process)
+        self.root.after(self.exit_poll_interval, self._poll_process_exits)
+    
+    def _on_process_exit(self, key, process):
+        """Handle a child process exiting on its own"""
+        slot = self.slots[key]
+        if slot.process is not process:
+            # Stopped from the GUI or relaunched since - nothing to do
+            return
+        
+        slot.process = None
+        slot.active = False
+        self._update_ui(slot)
+        self.log_activity(slot.ended_message)
+    
+    def _update_ui(self, slot):
+        """Update a slot's status label and button"""
+        if slot.active:
+            self._queue_config(slot.status_label, text="Active", fg="green")
+            self._queue_config(slot.button, text=slot.stop_text, style="Danger.TButton")
+            self.log_activity(slot.active_message)
+            self.update_status(slot.active_status, "#27ae60")
         else:
-            self.voice_status_label.config(text="Inactive", fg="red")
-            self.voice_button.config(
-                text="Start Voice Control",
-                bg="#2ecc71"
-            )
+            self._queue_config(slot.status_label, text="Inactive", fg="red")
+            self._queue_config(slot.button, text=slot.start_text, style=slot.idle_style)
     
     def start_both(self):
         """Start both systems"""
         self.log_activity("Starting BOTH systems for full control!")
         
-        if not self.eye_tracking_active:
-            self.toggle_eye_tracking()
-        
-        # Delay voice control start slightly
-        self.root.after(1000, lambda: self.toggle_voice_control() if not self.voice_control_active else None)
+        # The two processes are independent - no need to stagger them
+        for key, slot in self.slots.items():
+            if not slot.active:
+                self.toggle(key)
         
         self.update_status("Full hands-free control active!", "#27ae60")
     
     def show_commands(self):
         """Show voice commands"""
-        commands_window = tk.Toplevel(self.root)
-        commands_window.title("Voice Commands Reference")
-        commands_window.geometry("550x650")
-        
-        tk.Label(
-            commands_window,
-            text="Voice Commands",
-            font=("Arial", 18, "bold")
-        ).pack(pady=15)
-        
-        text = scrolledtext.ScrolledText(
-            commands_window,
-            width=65,
-            height=32,
-            font=("Courier", 10),
-            bg="#ecf0f1"
-        )
-        text.pack(padx=15, pady=10, fill=tk.BOTH, expand=True)
-        
-        commands_text = """
-* APPLICATIONS (9 commands):
-  • open safari / chrome / firefox
-  • open notes / terminal / mail
-  • open finder / messages / calendar
-
-* WINDOW MANAGEMENT (10 commands):
-  • close window / close tab
-  • new tab / new window
-  • minimize / maximize / full screen
-  • next window / previous window
-  • quit app
-
-* NAVIGATION (10 commands):
-  • scroll down / scroll up
-  • page down / page up
-  • go back / go forward
-  • refresh / reload
-
-* TAB MANAGEMENT (3 commands):
-  • next tab / previous tab
-  • reopen tab
-
-* SYSTEM CONTROLS (8 commands):
-  • volume up / volume down / mute / unmute
-  • brightness up / brightness down
-  • take screenshot / screen shot
-  • sleep
-
-* DICTATION (2 commands):
-  • type / start typing (then speak text)
-  • stop typing (exit dictation mode)
-
-* SEARCH (2 commands):
-  • search [your query]
-  • google [your query]
-
-* SPECIAL (2 commands):
-  • help / list commands
-  • exit / quit voice / stop listening
-
-TOTAL: 46+ Commands Available!
-"""
-        
-        text.insert("1.0", commands_text)
-        text.config(state=tk.DISABLED)
-        
-        tk.Button(
-            commands_window,
-            text="Close",
-            command=commands_window.destroy,
-            width=15,
-            height=2,
-            bg="#95a5a6",
-            fg="white",
-            font=("Arial", 10, "bold")
-        ).pack(pady=15)
+        self._show_reference('commands')
     
     def show_help(self):
         """Show help window"""
-        help_window = tk.Toplevel(self.root)
-        help_window.title("BlinkOS Help")
-        help_window.geometry("500x600")
-        
-        tk.Label(
-            help_window,
-            text="How to Use BlinkOS",
-            font=("Arial", 18, "bold")
-        ).pack(pady=15)
-        
-        text = scrolledtext.ScrolledText(
-            help_window,
-            width=60,
-            height=28,
-            font=("Arial", 10),
-            bg="#ecf0f1"
-        )
-        text.pack(padx=15, pady=10, fill=tk.BOTH, expand=True)
-        
-        help_text = """
-GETTING STARTED:
-================
-
-1. Click "Start Both Systems" for full control
-   OR start them individually
-
-2. Eye Tracking Window:
-   - Move your HEAD to control cursor
-   - BLINK to click
-   - Press 'Q' to quit
-   - Press 'K' to toggle clicking
-   - Press '+/-' to adjust sensitivity
-
-3. Voice Control:
-   - Say commands clearly
-   - Wait for "Listening..." prompt
-   - Say "help" to list all commands
-   - Say "exit" to quit
-
-BEST PRACTICES:
-===============
-
-Eye Tracking:
-  ✓ Sit ~50cm from camera
-  ✓ Good front lighting (no backlighting)
-  ✓ Keep head movements smooth
-  ✓ Blink deliberately for clicks
-
-Voice Control:
-  ✓ Speak clearly and at normal volume
-  ✓ Wait for recognition before next command
-  ✓ Use exact command phrases
-  ✓ Say "type" to enter dictation mode
-
-DEMO SCENARIOS:
-===============
-
-Scenario 1: Web Browsing
-  1. Say "open safari"
-  2. Move head to address bar, blink
-  3. Say "search artificial intelligence"
-  4. Say "scroll down"
-
-Scenario 2: Document Creation
-  1. Say "open notes"
-  2. Say "new window"
-  3. Say "type"
-  4. Speak your text
-  5. Say "stop typing"
-
-Scenario 3: System Control
-  1. Say "volume up"
-  2. Say "brightness down"
-  3. Say "take screenshot"
-  4. Say "minimize"
-
-TROUBLESHOOTING:
-================
-
-Eye tracking not working:
-  → Check camera permissions
-  → Improve lighting
-  → Adjust sensitivity with +/-
-
-Voice not recognized:
-  → Speak louder/clearer
-  → Check microphone permissions
-  → Reduce background noise
-
-System slow:
-  → Close other applications
-  → Restart BlinkOS
-  → Check CPU usage
-
-For more help, see README.md
-"""
-        
-        text.insert("1.0", help_text)
-        text.config(state=tk.DISABLED)
-        
-        tk.Button(
-            help_window,
-            text="Close",
-            command=help_window.destroy,
-            width=15,
-            height=2,
-            bg="#3498db",
-            fg="white",
-            font=("Arial", 10, "bold")
-        ).pack(pady=15)
+        self._show_reference('help')
     
     def show_demo_scenarios(self):
         """Show demo scenarios"""
-        demo_window = tk.Toplevel(self.root)
-        demo_window.title("Demo Scenarios")
-        demo_window.geometry("550x600")
+        self._show_reference('demo')
+    
+    def _show_reference(self, key):
+        """
+        Show a reference window from REFERENCE_WINDOWS
+        
+        The window and its text are built on first use; closing only hides it.
+        """
+        window = self._reference_windows.get(key)
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            return
+        
+        from tkinter import scrolledtext  # Only needed once a reference window opens
+        
+        spec = REFERENCE_WINDOWS[key]
+        window = tk.Toplevel(self.root)
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        window.title(spec['title'])
+        window.geometry(spec['geometry'])
+        self._reference_windows[key] = window
         
         tk.Label(
-            demo_window,
-            text="Hackathon Demo Scenarios",
+            window,
+            text=spec['heading'],
             font=("Arial", 18, "bold")
         ).pack(pady=15)
         
         text = scrolledtext.ScrolledText(
-            demo_window,
-            width=65,
-            height=28,
-            font=("Arial", 10),
+            window,
+            width=spec['width'],
+            height=spec['height'],
+            font=spec['font'],
             bg="#ecf0f1"
         )
         text.pack(padx=15, pady=10, fill=tk.BOTH, expand=True)
         
-        demo_text = """
-DEMO SCENARIO 1: Web Research (2 min)
-========================================
-
-Goal: Search for information hands-free
-
-Steps:
-1. Voice: "open safari"
-2. Head: Move cursor to address bar
-3. Blink: Click address bar
-4. Voice: "search machine learning basics"
-5. Head + Blink: Click first result
-6. Voice: "scroll down"
-7. Voice: "scroll down"
-8. Voice: "go back"
-9. Voice: "close tab"
-
-Impact: Shows seamless browsing without hands!
-
-
-DEMO SCENARIO 2: Document Creation (2 min)
-==============================================
-
-Goal: Create and edit a document
-
-Steps:
-1. Voice: "open notes"
-2. Voice: "new window"
-3. Voice: "type"
-4. Voice: "Dear Team comma I am excited to present 
-   BlinkOS comma a hands free computer control 
-   system period New paragraph This system uses 
-   eye tracking and voice recognition period"
-5. Voice: "stop typing"
-6. Head + Blink: Select text (optional)
-7. Voice: "close window"
-
-Impact: Shows accessibility for typing!
-
-
-DEMO SCENARIO 3: System Control (1.5 min)
-============================================
-
-Goal: Control system without touching anything
-
-Steps:
-1. Voice: "open finder"
-2. Head + Blink: Navigate folders
-3. Voice: "volume up"
-4. Voice: "brightness down"
-5. Voice: "take screenshot"
-6. Voice: "minimize"
-7. Voice: "open terminal"
-8. Voice: "quit app"
-
-Impact: Shows system-wide control!
-
-
-DEMO SCENARIO 4: Multi-App Workflow (2.5 min)
-================================================
-
-Goal: Complete workflow across multiple apps
-
-Steps:
-1. Voice: "open safari"
-2. Voice: "search github"
-3. Head + Blink: Click GitHub
-4. Voice: "open notes"
-5. Voice: "type"
-6. Voice: "GitHub is a platform for... (description)"
-7. Voice: "stop typing"
-8. Voice: "next window" (back to Safari)
-9. Voice: "scroll down"
-10. Voice: "previous window" (back to Notes)
-11. Voice: "close window"
-
-Impact: Shows real-world usage!
-
-
-PRESENTATION TIPS:
-==================
-
-✓ Start with problem statement (accessibility)
-✓ Show live demo (2-3 scenarios)
-✓ Have backup video ready
-✓ Explain technology briefly
-✓ Emphasize impact on users
-✓ Practice transitions between scenarios
-✓ Time yourself (< 5 minutes total)
-"""
-        
-        text.insert("1.0", demo_text)
+        text.insert("1.0", spec['text'])
         text.config(state=tk.DISABLED)
         
-        tk.Button(
-            demo_window,
+        ttk.Button(
+            window,
             text="Close",
-            command=demo_window.destroy,
+            command=window.withdraw,
             width=15,
-            height=2,
-            bg="#9b59b6",
-            fg="white",
-            font=("Arial", 10, "bold")
+            style=spec['button_style']
         ).pack(pady=15)
     
     def on_closing(self):
@@ -749,21 +842,18 @@ PRESENTATION TIPS:
         self.log_activity("Shutting down BlinkOS...")
         
         # Stop processes
-        if self.eye_tracking_active:
-            self.stop_eye_tracking()
+        for key, slot in self.slots.items():
+            if slot.active:
+                self.stop(key)
         
-        if self.voice_control_active:
-            self.stop_voice_control()
+        # Write out anything still waiting for the next flush tick
+        self._flush_log()
         
         self.root.destroy()
     
     def run(self):
         """Start the application"""
-        print("\n" + "="*60)
-        print("BlinkOS - Hands-Free Computer Control System")
-        print("="*60)
-        print("\nControl Panel launched!")
-        print("Use the GUI to control the system\n")
+        sys.stdout.write(_BANNER)
         
         # Start GUI main loop
         self.root.mainloop()
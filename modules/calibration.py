@@ -8,10 +8,36 @@ so that I can have the comeplete access to the screen with the right movement of
 
 import cv2
 import numpy as np
-import pickle
 import os
+import math
+import queue
+import threading
 import time
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _make_predictor(min_x, min_y, scale_x, scale_y, max_x, max_y):
+    """
+    Build a single-point form of apply_calibration's linear mapping with the
+    calibration constants baked in
+    
+    (x - min) / range, clamped to 0-1, times the screen size and clamped to
+    size - 1 folds into one multiply and one clamp per axis.
+    Compiled with numba when it is available.
+    """
+    def predict(x, y):
+        screen_x = min(max((x - min_x) * scale_x, 0.0), max_x)
+        screen_y = min(max((y - min_y) * scale_y, 0.0), max_y)
+        return screen_x, screen_y
+    
+    if njit is not None:
+        predict = njit(predict)
+    return predict
+
 
 class Calibration:
     """
@@ -19,7 +45,7 @@ class Calibration:
     Uses 9-point calibration to create accurate face->screen mapping
     """
     
-    def __init__(self, screen_w, screen_h, save_path='data/calibration.pkl'):
+    def __init__(self, screen_w, screen_h, save_path='data/calibration.npz', use_opencl=False):
         """
         Initialize calibration
         
@@ -27,10 +53,15 @@ class Calibration:
             screen_w: Screen width in pixels
             screen_h: Screen height in pixels
             save_path: Path to save calibration data
+            use_opencl: Keep the calibration display in a cv2.UMat (OpenCL)
+                        when OpenCV reports an OpenCL device
         """
         self.screen_w = screen_w
         self.screen_h = screen_h
         self.save_path = save_path
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
         
         # Create data directory if needed
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
@@ -49,20 +80,38 @@ class Calibration:
             (0.9, 0.9),   # Bottom-right
         ]
         
-        # Collected data
-        self.face_positions = []
-        self.screen_positions = []
+        # Camera frames are downscaled to this (w, h) before FaceMesh, and
+        # only every Nth frame is run through it during calibration
+        self.inference_size = (320, 240)
+        self.inference_every = 2
         
-        # Transformation parameters
+        # Pixel centres of the calibration points on this screen
+        self._update_point_px()
+        
+        # Collected data - one row per calibration point, filled in by index
+        n_points = len(self.calibration_points)
+        self.face_positions = np.zeros((n_points, 2), dtype=np.float64)
+        self.screen_positions = np.zeros((n_points, 2), dtype=np.int32)
+        self._n_collected = 0
+        
+        # Transformation parameters - polynomial coefficients, shape (n_features, 2)
         self.transform_matrix = None
         self.is_calibrated = False
         
+        # Face position range seen during calibration (set by _update_face_range)
+        self._face_min = None
+        self._face_range = None
+        self._screen_size = None
+        self._screen_max = None
+        self._predict = None
+        
         # Colors for UI
         self.color_inactive = (100, 100, 100)
         self.color_active = (0, 255, 0)
         self.color_completed = (0, 0, 255)
         
-    def draw_calibration_point(self, img, point_idx, is_active=False, is_completed=False):
+    def draw_calibration_point(self, img, point_idx, is_active=False, is_completed=False,
+                               pulse_radius=None):
         """
         Draw a calibration point on the screen
         
@@ -71,13 +120,13 @@ class Calibration:
             point_idx: Index of calibration point
             is_active: Whether this is the current point
             is_completed: Whether this point is completed
+            pulse_radius: Radius of the pulsing ring on the active point
+                          (computed from the clock if not given)
         """
         if point_idx >= len(self.calibration_points):
             return
         
-        norm_x, norm_y = self.calibration_points[point_idx]
-        x = int(norm_x * img.shape[1])
-        y = int(norm_y * img.shape[0])
+        x, y = self._point_px[point_idx]
         
         # Choose color
         if is_completed:
@@ -99,9 +148,32 @@ class Calibration:
             cv2.line(img, (x, y - 60), (x, y + 60), color, 2)
             
             # Pulsing animation
-            pulse_radius = int(30 + 10 * np.sin(time.time() * 5))
+            if pulse_radius is None:
+                pulse_radius = self._pulse_radius()
             cv2.circle(img, (x, y), pulse_radius, color, 2)
     
+    @staticmethod
+    def _pulse_radius():
+        """Radius of the active point's pulsing ring at the current time"""
+        return int(30 + 10 * math.sin(time.time() * 5))
+    
+    def _update_point_px(self):
+        """Precompute integer screen coordinates of each calibration point"""
+        self._point_px = [(int(norm_x * self.screen_w), int(norm_y * self.screen_h))
+                          for norm_x, norm_y in self.calibration_points]
+    
+    def _calibration_dirty_regions(self):
+        """
+        Rectangles (x1, y1, x2, y2) redrawn every calibration frame:
+        one box per calibration point plus the top and bottom text strips
+        """
+        half = 62  # Crosshair reaches 60px from the centre, plus line width
+        regions = [(0, 0, self.screen_w, 70),
+                   (0, max(0, self.screen_h - 85), self.screen_w, self.screen_h)]
+        for x, y in self._point_px:
+            regions.append((max(0, x - half), max(0, y - half), x + half, y + half))
+        return regions
+    
     def run_calibration(self, face_mesh, cam):
         """
         Run the calibration process
@@ -124,43 +196,37 @@ class Calibration:
         print("\nReady? Press SPACE to start...")
         print("="*60 + "\n")
         
-        # Wait for user to be ready
+        # Instruction screen is static - render it once
+        instruction_img = np.zeros((self.screen_h, self.screen_w, 3), dtype=np.uint8)
+        
+        # Title
+        cv2.putText(instruction_img, "CALIBRATION", 
+                   (self.screen_w//2 - 200, 100),
+                   cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
+        
+        # Instructions
+        instructions = [
+            "Look at each green circle",
+            "Keep your head still",
+            "Press SPACE when looking at circle",
+            "",
+            "Press SPACE to start",
+            "Press ESC to cancel"
+        ]
+        
+        y_pos = 250
+        for instruction in instructions:
+            cv2.putText(instruction_img, instruction,
+                       (self.screen_w//2 - 250, y_pos),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
+            y_pos += 60
+        
+        # Wait for user to be ready - static screen, so no camera reads or
+        # inference until SPACE is pressed
+        cv2.imshow('Calibration', instruction_img)
         ready = False
         while not ready:
-            ret, frame = cam.read()
-            if not ret:
-                return False
-            
-            frame = cv2.flip(frame, 1)
-            
-            # Show instruction screen
-            instruction_img = np.zeros((self.screen_h, self.screen_w, 3), dtype=np.uint8)
-            
-            # Title
-            cv2.putText(instruction_img, "CALIBRATION", 
-                       (self.screen_w//2 - 200, 100),
-                       cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
-            
-            # Instructions
-            instructions = [
-                "Look at each green circle",
-                "Keep your head still",
-                "Press SPACE when looking at circle",
-                "",
-                "Press SPACE to start",
-                "Press ESC to cancel"
-            ]
-            
-            y_pos = 250
-            for instruction in instructions:
-                cv2.putText(instruction_img, instruction,
-                           (self.screen_w//2 - 250, y_pos),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-                y_pos += 60
-            
-            cv2.imshow('Calibration', instruction_img)
-            
-            key = cv2.waitKey(1) & 0xFF
+            key = cv2.waitKey(30) & 0xFF
             if key == ord(' '):
                 ready = True
             elif key == 27:  # ESC
@@ -169,36 +235,132 @@ class Calibration:
                 return False
         
         # Run calibration for each point
-        self.face_positions = []
-        self.screen_positions = []
+        self._n_collected = 0
+        
+        # One display buffer for the whole run; each frame only clears the
+        # regions that get redrawn instead of zeroing a full-screen image
+        calib_img = np.zeros((self.screen_h, self.screen_w, 3), dtype=np.uint8)
+        if self.use_opencl:
+            calib_img = cv2.UMat(calib_img)
+        dirty_regions = self._calibration_dirty_regions()
+        
+        # Camera + FaceMesh run in a background thread; the UI loop only draws
+        # and reads the most recent nose position, so it keeps animating
+        # while inference is busy
+        latest = queue.Queue(maxsize=1)
+        stop_event = threading.Event()
+        worker = threading.Thread(
+            target=self._inference_worker,
+            args=(face_mesh, cam, latest, stop_event),
+            daemon=True
+        )
+        worker.start()
+        
+        try:
+            collected = self._collect_points(calib_img, dirty_regions, latest)
+        finally:
+            stop_event.set()
+            worker.join()
+        
+        cv2.destroyWindow('Calibration')
+        
+        if not collected:
+            return False
+        
+        # Calculate transformation
+        print("\nCalculating transformation matrix...")
+        success = self.calculate_transformation()
+        
+        if success:
+            print("Calibration complete!")
+            self.save_calibration()
+            return True
+        else:
+            print("Calibration failed - please try again")
+            return False
+    
+    def _inference_worker(self, face_mesh, cam, latest, stop_event):
+        """
+        Background thread for run_calibration: read frames, run FaceMesh and
+        publish (camera_ok, nose_position) to `latest`, keeping only the newest
+        """
+        frame_count = 0
+        while not stop_event.is_set():
+            # Every frame is read so the camera buffer never goes stale...
+            ret, frame = cam.read()
+            if not ret:
+                self._publish_latest(latest, (False, None))
+                return
+            
+            # ...but only every Nth one is processed; the UI keeps showing the
+            # last published position in between
+            frame_count += 1
+            if frame_count % self.inference_every:
+                continue
+            
+            # Only the normalized nose position is needed, so run
+            # FaceMesh on a downscaled copy of the frame
+            frame = cv2.resize(frame, self.inference_size, interpolation=cv2.INTER_AREA)
+            frame = cv2.flip(frame, 1)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            results = face_mesh.process(rgb_frame)
+            
+            if results.multi_face_landmarks:
+                nose = results.multi_face_landmarks[0].landmark[1]
+                self._publish_latest(latest, (True, (nose.x, nose.y)))
+            else:
+                self._publish_latest(latest, (True, None))
+    
+    @staticmethod
+    def _publish_latest(latest, item):
+        """Replace whatever is waiting in a maxsize=1 queue with `item`"""
+        try:
+            latest.get_nowait()
+        except queue.Empty:
+            pass
+        latest.put_nowait(item)
+    
+    def _collect_points(self, calib_img, dirty_regions, latest):
+        """
+        UI loop of run_calibration: show each point and collect samples
+        
+        Returns:
+            bool: True if all points were collected, False if cancelled
+                  or the camera stopped delivering frames
+        """
+        nose = None
+        fresh = False
         
-        for point_idx, (norm_x, norm_y) in enumerate(self.calibration_points):
-            screen_x = int(norm_x * self.screen_w)
-            screen_y = int(norm_y * self.screen_h)
+        for point_idx, (screen_x, screen_y) in enumerate(self._point_px):
             
             print(f"\nPoint {point_idx + 1}/9: Look at the GREEN circle")
             
-            # Collect samples for this point
-            samples = []
+            # Collect samples for this point (running sums, averaged at the end)
+            sum_x = sum_y = 0.0
+            n_samples = 0
             collecting = True
             
             while collecting:
-                ret, frame = cam.read()
-                if not ret:
-                    return False
-                
-                frame = cv2.flip(frame, 1)
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                results = face_mesh.process(rgb_frame)
+                # Pick up the newest inference result, if any arrived
+                try:
+                    camera_ok, nose = latest.get_nowait()
+                    if not camera_ok:
+                        return False
+                    fresh = True
+                except queue.Empty:
+                    pass
                 
-                # Create calibration display
-                calib_img = np.zeros((self.screen_h, self.screen_w, 3), dtype=np.uint8)
+                # Clear last frame's drawing (cv2.rectangle works on ndarray and UMat)
+                for x1, y1, x2, y2 in dirty_regions:
+                    cv2.rectangle(calib_img, (x1, y1), (x2 - 1, y2 - 1), (0, 0, 0), -1)
                 
-                # Draw all points
+                # Draw all points (clock sampled once per frame)
+                pulse_radius = self._pulse_radius()
                 for i in range(len(self.calibration_points)):
                     is_active = (i == point_idx)
                     is_completed = (i < point_idx)
-                    self.draw_calibration_point(calib_img, i, is_active, is_completed)
+                    self.draw_calibration_point(calib_img, i, is_active, is_completed,
+                                                pulse_radius)
                 
                 # Instructions
                 cv2.putText(calib_img, f"Point {point_idx + 1} / 9",
@@ -210,11 +372,7 @@ class Calibration:
                            cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
                 
                 # Show face detection status
-                if results.multi_face_landmarks:
-                    landmarks = results.multi_face_landmarks[0].landmark
-                    nose = landmarks[1]
-                    face_x, face_y = nose.x, nose.y
-                    
+                if nose is not None:
                     cv2.putText(calib_img, "Face detected",
                                (20, 30),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
@@ -225,49 +383,40 @@ class Calibration:
                 
                 cv2.imshow('Calibration', calib_img)
                 
-                key = cv2.waitKey(1) & 0xFF
+                # ~60 Hz redraw; inference runs at its own pace in the worker
+                key = cv2.waitKey(15) & 0xFF
                 
-                if key == ord(' ') and results.multi_face_landmarks:
+                # Each sample must come from a new frame
+                if key == ord(' ') and nose is not None and fresh:
                     # Collect sample
-                    landmarks = results.multi_face_landmarks[0].landmark
-                    nose = landmarks[1]
-                    face_x, face_y = nose.x, nose.y
+                    face_x, face_y = nose
+                    fresh = False
                     
-                    samples.append((face_x, face_y))
+                    sum_x += face_x
+                    sum_y += face_y
+                    n_samples += 1
                     
                     # Need 3 samples per point for stability
-                    if len(samples) >= 3:
+                    if n_samples >= 3:
                         # Average samples
-                        avg_face_x = np.mean([s[0] for s in samples])
-                        avg_face_y = np.mean([s[1] for s in samples])
+                        avg_face_x = sum_x / n_samples
+                        avg_face_y = sum_y / n_samples
                         
-                        self.face_positions.append([avg_face_x, avg_face_y])
-                        self.screen_positions.append([screen_x, screen_y])
+                        self.face_positions[point_idx] = (avg_face_x, avg_face_y)
+                        self.screen_positions[point_idx] = (screen_x, screen_y)
+                        self._n_collected += 1
                         
                         print(f"Point {point_idx + 1} calibrated: face=({avg_face_x:.3f}, {avg_face_y:.3f})")
                         
                         collecting = False
                     else:
-                        print(f"   Sample {len(samples)}/3 collected")
+                        print(f"   Sample {n_samples}/3 collected")
                 
                 elif key == 27:  # ESC
                     print("Calibration cancelled")
-                    cv2.destroyWindow('Calibration')
                     return False
         
-        cv2.destroyWindow('Calibration')
-        
-        # Calculate transformation
-        print("\nCalculating transformation matrix...")
-        success = self.calculate_transformation()
-        
-        if success:
-            print("Calibration complete!")
-            self.save_calibration()
-            return True
-        else:
-            print("Calibration failed - please try again")
-            return False
+        return True
     
     def calculate_transformation(self):
         """
@@ -277,28 +426,29 @@ class Calibration:
         Returns:
             bool: True if successful
         """
-        if len(self.face_positions) < 9:
+        if self._n_collected < len(self.calibration_points):
             return False
         
-        face_array = np.array(self.face_positions)
-        screen_array = np.array(self.screen_positions)
+        face_array = self.face_positions
+        screen_array = self.screen_positions
+        
+        # Face range also defines the [-1, 1] domain of the polynomial basis
+        self._update_face_range()
         
-        # Use QUADRATIC only (less aggressive than cubic)
-        # This prevents over-amplification on small screens
-        def create_features(positions):
-            x = positions[:, 0]
-            y = positions[:, 1]
-            return np.column_stack([
-                np.ones_like(x),     # bias
-                x, y,                # linear terms
-                x**2, x*y, y**2,     # quadratic terms (stopped here!)
-            ])
+        X = self._chebyshev_features(face_array)
         
-        X = create_features(face_array)
+        # Solve the normal equations once for both screen axes (one 6x6 solve,
+        # two right-hand sides) instead of two separate lstsq/SVD calls
+        A = X.T @ X
+        B = X.T @ screen_array
+        try:
+            coefficients = np.linalg.solve(A, B)
+        except np.linalg.LinAlgError:
+            # Degenerate samples (e.g. head didn't move) - fall back to lstsq
+            coefficients = np.linalg.lstsq(X, screen_array, rcond=None)[0]
         
-        # Solve for transformation (separate for x and y)
-        self.transform_matrix_x = np.linalg.lstsq(X, screen_array[:, 0], rcond=None)[0]
-        self.transform_matrix_y = np.linalg.lstsq(X, screen_array[:, 1], rcond=None)[0]
+        # One (n_features, 2) matrix: column 0 -> screen x, column 1 -> screen y
+        self.transform_matrix = np.ascontiguousarray(coefficients, dtype=np.float64)
         
         self.is_calibrated = True
         
@@ -309,6 +459,31 @@ class Calibration:
         
         return True
     
+    def _chebyshev_features(self, positions):
+        """
+        Polynomial features for the calibration fit
+        
+        Uses QUADRATIC only (less aggressive than cubic) - this prevents
+        over-amplification on small screens. Face positions only span a small
+        part of 0-1, so they are first rescaled to [-1, 1] over the calibrated
+        range and expanded in a Chebyshev basis (1, u, v, T2(u), uv, T2(v)),
+        which keeps X^T X well conditioned compared to raw monomials
+        
+        Args:
+            positions: Nx2 array of face positions (normalized)
+            
+        Returns:
+            Nx6 feature matrix
+        """
+        uv = 2.0 * (positions - self._face_min) / self._face_range - 1.0
+        u = uv[:, 0]
+        v = uv[:, 1]
+        return np.column_stack([
+            np.ones_like(u),                       # T0 (bias)
+            u, v,                                  # T1 (linear) terms
+            2 * u * u - 1, u * v, 2 * v * v - 1,   # degree-2 terms (stopped here!)
+        ])
+    
     def apply_calibration(self, face_positions):
         """
         Apply SIMPLE linear calibration
@@ -328,48 +503,70 @@ class Calibration:
         if face_positions.ndim == 1:
             face_positions = face_positions.reshape(1, -1)
         
-        x = face_positions[:, 0]
-        y = face_positions[:, 1]
-        
-        # Use calibration data to find min/max face positions
-        face_array = np.array(self.face_positions)
-        face_min_x = np.min(face_array[:, 0])
-        face_max_x = np.max(face_array[:, 0])
-        face_min_y = np.min(face_array[:, 1])
-        face_max_y = np.max(face_array[:, 1])
-        
-        # Map face range to screen range (simple linear)
-        norm_x = (x - face_min_x) / (face_max_x - face_min_x + 0.001)
-        norm_y = (y - face_min_y) / (face_max_y - face_min_y + 0.001)
+        # Map face range to screen range (simple linear), both axes at once;
+        # everything after the first subtraction works in place on one array
+        screen = face_positions - self._face_min
+        screen /= self._face_range
         
         # Clamp to 0-1
-        norm_x = np.clip(norm_x, 0, 1)
-        norm_y = np.clip(norm_y, 0, 1)
+        np.clip(screen, 0, 1, out=screen)
         
         # Map to screen
-        screen_x = norm_x * self.screen_w
-        screen_y = norm_y * self.screen_h
+        screen *= self._screen_size
         
         # Final clamp
-        screen_x = np.clip(screen_x, 0, self.screen_w - 1)
-        screen_y = np.clip(screen_y, 0, self.screen_h - 1)
+        np.clip(screen, 0, self._screen_max, out=screen)
         
-        return np.column_stack([screen_x, screen_y])
+        return screen
     
-    def save_calibration(self):
-        """Save calibration data to file"""
-        data = {
-            'face_positions': self.face_positions,
-            'screen_positions': self.screen_positions,
-            'transform_matrix_x': self.transform_matrix_x,
-            'transform_matrix_y': self.transform_matrix_y,
-            'screen_w': self.screen_w,
-            'screen_h': self.screen_h,
-            'is_calibrated': self.is_calibrated
-        }
+    def apply_calibration_point(self, face_x, face_y):
+        """
+        Map a single face position to screen coordinates
+        
+        Same result as apply_calibration for one point, but works on plain
+        floats so the per-frame cursor path skips NumPy dispatch entirely
+        
+        Returns:
+            (screen_x, screen_y) as floats
+        """
+        if not self.is_calibrated:
+            return face_x * self.screen_w, face_y * self.screen_h
         
+        return self._predict(face_x, face_y)
+    
+    def _update_face_range(self):
+        """
+        Cache the min/max face positions used by apply_calibration
+        
+        Called whenever calibration data changes, so the per-frame mapping
+        doesn't rebuild an array from the collected points every call
+        """
+        face_array = self.face_positions
+        self._face_min = face_array.min(axis=0)
+        self._face_range = face_array.max(axis=0) - self._face_min + 0.001
+        self._screen_size = np.array([self.screen_w, self.screen_h], dtype=np.float64)
+        self._screen_max = self._screen_size - 1
+        
+        # Specialized single-point mapping for apply_calibration_point
+        min_x, min_y = (float(v) for v in self._face_min)
+        scale_x, scale_y = (float(v) for v in self._screen_size / self._face_range)
+        self._predict = _make_predictor(min_x, min_y, scale_x, scale_y,
+                                        float(self.screen_w - 1), float(self.screen_h - 1))
+        if njit is not None:
+            # Compile now rather than on the first tracked frame
+            self._predict(min_x, min_y)
+    
+    def save_calibration(self):
+        """Save calibration data to file (NumPy .npz archive)"""
+        # Passing a file object stops np.savez from appending its own suffix
         with open(self.save_path, 'wb') as f:
-            pickle.dump(data, f)
+            np.savez(
+                f,
+                face_positions=self.face_positions,
+                screen_positions=self.screen_positions,
+                transform_matrix=self.transform_matrix,
+                meta=np.array([self.screen_w, self.screen_h, int(self.is_calibrated)])
+            )
         
         print(f"Calibration saved to {self.save_path}")
     
@@ -385,16 +582,20 @@ class Calibration:
             return False
         
         try:
-            with open(self.save_path, 'rb') as f:
-                data = pickle.load(f)
+            # Plain arrays only - no pickle, so loading can't run code
+            with np.load(self.save_path, allow_pickle=False) as data:
+                self.face_positions = data['face_positions'].astype(np.float64)
+                self.screen_positions = data['screen_positions'].astype(np.int32)
+                self.transform_matrix = data['transform_matrix']
+                screen_w, screen_h, is_calibrated = (int(v) for v in data['meta'])
             
-            self.face_positions = data['face_positions']
-            self.screen_positions = data['screen_positions']
-            self.transform_matrix_x = data['transform_matrix_x']
-            self.transform_matrix_y = data['transform_matrix_y']
-            self.screen_w = data['screen_w']
-            self.screen_h = data['screen_h']
-            self.is_calibrated = data['is_calibrated']
+            self._n_collected = len(self.face_positions)
+            self.screen_w = screen_w
+            self.screen_h = screen_h
+            self._update_point_px()
+            self.is_calibrated = bool(is_calibrated)
+            if self.is_calibrated:
+                self._update_face_range()
             
             print(f"Calibration loaded from {self.save_path}")
             return True
@@ -418,11 +619,12 @@ if __name__ == "__main__":
     cam.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
     cam.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
     
-    # Setup face mesh
+    # Setup face mesh - calibration only reads the nose landmark, so the
+    # iris/lips refinement network isn't needed
     mp_face_mesh = mp.solutions.face_mesh
     face_mesh = mp_face_mesh.FaceMesh(
         max_num_faces=1,
-        refine_landmarks=True,
+        refine_landmarks=False,
         min_detection_confidence=0.5,
         min_tracking_confidence=0.5
     )
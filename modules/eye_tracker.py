@@ -8,11 +8,21 @@ import cv2
 import mediapipe as mp
 import pyautogui
 import numpy as np
-from collections import deque
 import time
 import platform
+import queue
+import signal
+import threading
 import subprocess
 import os
+import math
+import operator
+from types import SimpleNamespace
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 import sys
 from pathlib import Path
@@ -20,19 +30,187 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from modules.calibration import Calibration
 
 
+def _eye_aspect_ratios(points, right_cols, left_cols, ear_from, ear_to):
+    """
+    EAR of both eyes straight from the packed landmark array
+    
+    Written as explicit scalar loops so numba can compile it; only used when
+    numba is available (EyeTracker.calculate_ear is the plain-Python path).
+    """
+    ear_right = 0.0
+    ear_left = 0.0
+    for eye in range(2):
+        cols = right_cols if eye == 0 else left_cols
+        v1 = v2 = h = 0.0
+        for k in range(3):
+            a = cols[ear_from[k]]
+            b = cols[ear_to[k]]
+            dx = points[0, a] - points[0, b]
+            dy = points[1, a] - points[1, b]
+            dist = math.sqrt(dx * dx + dy * dy)
+            if k == 0:
+                v1 = dist
+            elif k == 1:
+                v2 = dist
+            else:
+                h = dist
+        ear = (v1 + v2) / (2.0 * h + 0.0001)
+        if eye == 0:
+            ear_right = ear
+        else:
+            ear_left = ear
+    return ear_right, ear_left
+
+
+if njit is not None:
+    _eye_aspect_ratios = njit(cache=True, fastmath=True)(_eye_aspect_ratios)
+
+
+class FaceLandmarkerMesh:
+    """
+    Tasks-API FaceLandmarker behind the FaceMesh.process() interface
+    
+    The Tasks API accepts a GPU delegate, which the legacy FaceMesh solution
+    does not. process() returns an object with the same
+    multi_face_landmarks[i].landmark shape, so the tracking loop and
+    Calibration can use either one.
+    """
+    
+    def __init__(self, model_path, use_gpu=True):
+        from mediapipe.tasks.python import BaseOptions, vision
+        
+        delegate = BaseOptions.Delegate.GPU if use_gpu else BaseOptions.Delegate.CPU
+        options = vision.FaceLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=str(model_path), delegate=delegate),
+            running_mode=vision.RunningMode.VIDEO,
+            num_faces=1,
+            min_face_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+            output_face_blendshapes=False,
+            output_facial_transformation_matrixes=False
+        )
+        self._landmarker = vision.FaceLandmarker.create_from_options(options)
+        self._last_timestamp = -1
+    
+    def process(self, rgb_frame):
+        """Run the landmarker on an RGB frame, FaceMesh-style"""
+        # VIDEO mode needs strictly increasing timestamps
+        timestamp = max(int(time.perf_counter() * 1000), self._last_timestamp + 1)
+        self._last_timestamp = timestamp
+        
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        result = self._landmarker.detect_for_video(image, timestamp)
+        return SimpleNamespace(multi_face_landmarks=[
+            SimpleNamespace(landmark=landmarks) for landmarks in result.face_landmarks
+        ])
+    
+    def close(self):
+        self._landmarker.close()
+
+
+def _kalman_step(state, q, r, z=None):
+    """
+    One step of a 1-D constant-velocity Kalman filter
+    
+    state is [position, velocity, P00, P01, P11] and is updated in place.
+    dt is one frame; q is the white-noise acceleration variance and r the
+    measurement variance. Without a measurement z this is predict-only.
+    
+    Returns:
+        The filtered position
+    """
+    p, v, a, b, c = state
+    
+    # Predict: F = [[1, 1], [0, 1]], Q = q * [[1/4, 1/2], [1/2, 1]]
+    p += v
+    a, b, c = a + 2 * b + c + 0.25 * q, b + c + 0.5 * q, c + q
+    
+    # Update with H = [1, 0]; the innovation covariance is a scalar
+    if z is not None:
+        s = a + r
+        k_p = a / s
+        k_v = b / s
+        innovation = z - p
+        p += k_p * innovation
+        v += k_v * innovation
+        a, b, c = (1 - k_p) * a, (1 - k_p) * b, c - k_v * b
+    
+    state[:] = (p, v, a, b, c)
+    return p
+
+
+def _make_native_mover(system):
+    """Build a direct cursor-move function for Windows / X11
+    
+    macOS is handled by the Quartz path in EyeTracker. Returns None when no
+    native API is available, in which case pyautogui is used.
+    """
+    if system == 'Windows':
+        try:
+            import ctypes
+            return ctypes.windll.user32.SetCursorPos
+        except Exception:
+            return None
+    if system == 'Linux':
+        try:
+            from Xlib import display
+            dpy = display.Display()
+            root = dpy.screen().root
+        except Exception:
+            return None
+        
+        def move(x, y):
+            root.warp_pointer(x, y)
+            dpy.flush()
+        return move
+    return None
+
 class EyeTracker:
     
-    def __init__(self):
-        """Initialize the eye tracker"""
+    # Debug text lines as (label, baseline y, font scale); values are drawn
+    # after the pre-rendered labels
+    DEBUG_LABELS = [
+        ("FPS:", 30, 0.7),
+        ("Face:", 60, 0.6),
+        ("Screen:", 90, 0.6),
+        ("EAR:", 120, 0.6),
+        ("Cursor:", 150, 0.7),
+        ("Click:", 180, 0.6),
+        ("Sensitivity:", 210, 0.6),
+        ("Calibrated:", 240, 0.6),
+    ]
+    
+    # Optional Tasks-API model; used instead of FaceMesh when present
+    LANDMARKER_MODEL = Path(__file__).parent.parent / 'data' / 'face_landmarker.task'
+    
+    def __init__(self, use_opencl=False):
+        """
+        Initialize the eye tracker
+        
+        Args:
+            use_opencl: Run the per-frame flip/resize/color conversion on
+                        cv2.UMat (OpenCL) when OpenCV reports an OpenCL device
+        """
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        
         # MediaPipe Face Mesh
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5,
-            static_image_mode=False
-        )
+        self.face_mesh = self._create_landmarker()
+        if self.face_mesh is None:
+            self.face_mesh = self.mp_face_mesh.FaceMesh(
+                max_num_faces=1,
+                # No iris refinement: the cursor follows the nose tip, so the
+                # iris points are never read. The refinement model also
+                # refines the eye contour (33/160/158/133/153/144...), so EAR
+                # comes out somewhat different; the adaptive blink baseline
+                # absorbs that, but a fixed blink_threshold would need retuning
+                refine_landmarks=False,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5,
+                static_image_mode=False
+            )
         
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
@@ -48,18 +226,39 @@ class EyeTracker:
         
         self.cam.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         self.cam.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        
+        # Keep only the newest frame queued so read() never hands back a stale one
+        self.cam.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.cam.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
         self.cam_w = int(self.cam.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.cam_h = int(self.cam.get(cv2.CAP_PROP_FRAME_HEIGHT))
         print(f"Camera resolution: {self.cam_w}x{self.cam_h}")
+        self._cam_scale = np.array([[self.cam_w], [self.cam_h]], dtype=np.float32)
+        
+        # FaceMesh runs on a downscaled copy; landmarks are normalized, so
+        # only the preview needs the full-size frame
+        self.inference_size = (320, 240)
         
         # Face landmarks
         self.NOSE_TIP = 1
         self.RIGHT_EYE = [33, 160, 158, 133, 153, 144]
         self.LEFT_EYE = [362, 385, 387, 263, 373, 380]
+        # EAR contour pairs: vertical (1,5), (2,4) and horizontal (0,3)
+        self._ear_from = (1, 2, 0)
+        self._ear_to = (5, 4, 3)
+        
+        # Only these landmarks are read each frame; landmarks_to_array packs
+        # them as columns [nose, right eye x6, left eye x6]
+        self._tracked_landmarks = [self.NOSE_TIP] + self.RIGHT_EYE + self.LEFT_EYE
+        self._get_tracked = operator.itemgetter(*self._tracked_landmarks)
+        self._right_eye_cols = tuple(range(1, 7))
+        self._left_eye_cols = tuple(range(7, 13))
+        if njit is not None:
+            # Compile now rather than on the first tracked frame
+            self.calculate_ears(np.zeros((2, len(self._tracked_landmarks)), np.float32))
         
         # Calibration mode
-        self.calibration = Calibration(self.screen_w, self.screen_h)
+        self.calibration = Calibration(self.screen_w, self.screen_h, use_opencl=self.use_opencl)
         self.is_calibrated = self.calibration.load_calibration()
         if self.is_calibrated:
             print("Calibration loaded - using calibrated mapping")
@@ -69,23 +268,28 @@ class EyeTracker:
         self.calibration_mode = False
         self.screen_margin_x = 0.25  # 25% margin on sides
         self.screen_margin_y = 0.20  # 20% margin top/bottom
+        self._update_screen_mapping()
         
-        # FPS
-        self.prev_time = 0
+        # FPS (EMA of frame time on the monotonic clock)
+        self.prev_time = time.perf_counter()
+        self._frame_time_ema = 1 / 30
         
-        # AGGRESSIVE SMOOTHING for stable cursor
-        self.smooth_buffer_size = 25  # Increased from 7 -> 15 ->  now 25
-        self.gaze_buffer_x = deque(maxlen=self.smooth_buffer_size)
-        self.gaze_buffer_y = deque(maxlen=self.smooth_buffer_size)
+        # Cursor smoothing: constant-velocity Kalman filter per axis
+        self.kalman_q = (0.05, 0.03)  # acceleration noise; head moves more sideways
+        self.kalman_r = 225.0         # measurement noise (~15 px std)
+        self._kalman_x = None
+        self._kalman_y = None
         
         # Blink detection
         self.blink_threshold = 0.20
         self.blink_counter = 0
         self.blink_frames_required = 3
+        self._ear_baseline_samples = []
+        self._ear_baseline_done = False
         
         # Click control
         self.click_enabled = True
-        self.last_click_time = 0
+        self.last_click_time = -math.inf
         self.click_cooldown = 1.0  # 1 second between clicks
         self.click_count = 0
         self.safe_zone_margin = 50
@@ -93,6 +297,23 @@ class EyeTracker:
         # Frame counter
         self._frame_count = 0
         
+        # FaceMesh runs on every Nth frame; in between, the cursor follows the
+        # Kalman filter's prediction
+        self.inference_every = 2
+        self._last_tracking = None
+        
+        # Pre-rendered debug labels, keyed by their colors
+        self._debug_label_cache = {}
+        
+        # Recycled (frame, rgb) buffer pairs for the capture thread
+        self._buffer_pool = queue.SimpleQueue()
+        
+        # Capture / inference threads, started by run()
+        self._stop_event = threading.Event()
+        self._pipeline_threads = []
+        self.pipeline_error = None  # First exception raised by a pipeline thread
+        self._calibrating = False  # run_calibration() owns the main thread
+        
         # PyAutoGUI settings
         pyautogui.FAILSAFE = False
         pyautogui.PAUSE = 0
@@ -111,46 +332,112 @@ class EyeTracker:
         except:
             pass
         
+        # afplay runs on a worker thread so forking it never stalls inference
+        self._sound_queue = queue.Queue(maxsize=4)
+        if self.use_sound_effects:
+            threading.Thread(target=self._sound_loop, daemon=True).start()
+        
         # Quartz for macOS
         self.use_quartz = platform.system() == 'Darwin'
         if self.use_quartz:
             try:
                 from Quartz import (CGEventCreateMouseEvent, CGEventPost, 
-                                  kCGEventMouseMoved, kCGHIDEventTap, 
+                                  CGEventSetLocation, kCGEventMouseMoved, kCGHIDEventTap, 
                                   CGEventSourceCreate, kCGEventSourceStateHIDSystemState)
                 self.CGEventCreateMouseEvent = CGEventCreateMouseEvent
                 self.CGEventPost = CGEventPost
+                self.CGEventSetLocation = CGEventSetLocation
                 self.kCGEventMouseMoved = kCGEventMouseMoved
                 self.kCGHIDEventTap = kCGHIDEventTap
                 self.event_source = CGEventSourceCreate(kCGEventSourceStateHIDSystemState)
+                # One mouse-moved event, re-positioned and re-posted on every move
+                self._mouse_event = CGEventCreateMouseEvent(
+                    self.event_source, kCGEventMouseMoved, (0, 0), 0
+                )
                 print("Using Quartz for cursor control")
             except Exception as e:
                 self.use_quartz = False
         
+        # SetCursorPos / XWarpPointer elsewhere, skipping pyautogui's checks
+        self._native_move = None if self.use_quartz else _make_native_mover(platform.system())
+        if self._native_move is not None:
+            print("Using native cursor control")
+        
         print("Eye Tracker initialized!")
         print("\nTIP: For best control, move your HEAD to control the cursor")
         print("   Keep your head ~50cm from camera, well-lit from front\n")
     
-    def get_face_position(self, landmarks):
+    def _create_landmarker(self):
+        """
+        Create a FaceLandmarkerMesh if the model file is available, trying
+        the GPU delegate first and then CPU
+        
+        Returns:
+            FaceLandmarkerMesh, or None to fall back to the FaceMesh solution
+        """
+        if not self.LANDMARKER_MODEL.exists():
+            return None
+        
+        for use_gpu in (True, False):
+            try:
+                landmarker = FaceLandmarkerMesh(self.LANDMARKER_MODEL, use_gpu=use_gpu)
+                print(f"Using FaceLandmarker ({'GPU' if use_gpu else 'CPU'} delegate)")
+                return landmarker
+            except Exception:
+                continue
+        return None
+    
+    def landmarks_to_array(self, landmarks):
+        """Copy the tracked landmarks into one (2, 13) float32 array
+        
+        Called once per frame so the helpers below index a NumPy array
+        instead of re-reading MediaPipe landmark objects. Row 0 holds every
+        x and row 1 every y, so each coordinate is one contiguous run.
+        """
+        tracked = self._get_tracked(landmarks)
+        return np.array([[p.x for p in tracked], [p.y for p in tracked]], dtype=np.float32)
+    
+    def get_face_position(self, points):
         """Get face position using nose tip"""
-        nose = landmarks[self.NOSE_TIP]
-        return nose.x, nose.y
+        return points[:, 0].tolist()
     
-    def calculate_ear(self, landmarks, eye_indices):
-        """Calculate Eye Aspect Ratio for blink detection"""
-        points = np.array([[landmarks[i].x, landmarks[i].y, landmarks[i].z] for i in eye_indices])
+    def calculate_ear(self, points, eye_cols):
+        """Calculate Eye Aspect Ratio for blink detection
         
-        v1 = np.linalg.norm(points[1] - points[5])
-        v2 = np.linalg.norm(points[2] - points[4])
-        h = np.linalg.norm(points[0] - points[3])
+        EAR is a 2-D ratio; MediaPipe's z is a noisy depth estimate and is
+        left out.
+        """
+        xs, ys = points.tolist()
+        return self._scalar_ear(xs, ys, eye_cols)
+    
+    @staticmethod
+    def _scalar_ear(xs, ys, eye_cols):
+        """EAR from plain float lists - for six points this beats any NumPy
+        expression, which is dominated by small-array allocations"""
+        p0, p1, p2, p3, p4, p5 = eye_cols
+        v1 = math.hypot(xs[p1] - xs[p5], ys[p1] - ys[p5])
+        v2 = math.hypot(xs[p2] - xs[p4], ys[p2] - ys[p4])
+        h = math.hypot(xs[p0] - xs[p3], ys[p0] - ys[p3])
+        return (v1 + v2) / (2.0 * h + 0.0001)
+    
+    def calculate_ears(self, points):
+        """
+        Calculate both eyes' EAR
         
-        ear = (v1 + v2) / (2.0 * h + 0.0001)
-        return ear
+        Returns:
+            (ear_right, ear_left)
+        """
+        if njit is not None:
+            return _eye_aspect_ratios(points, self._right_eye_cols, self._left_eye_cols,
+                                      self._ear_from, self._ear_to)
+        xs, ys = points.tolist()
+        return (self._scalar_ear(xs, ys, self._right_eye_cols),
+                self._scalar_ear(xs, ys, self._left_eye_cols))
     
     def adjust_blink_threshold(self, current_ear):
-        """Auto-adjust blink threshold"""
-        if not hasattr(self, '_ear_baseline_samples'):
-            self._ear_baseline_samples = []
+        """Auto-adjust blink threshold (once, from the first 30 open-eye samples)"""
+        if self._ear_baseline_done:
+            return
         
         if current_ear > 0.2:
             self._ear_baseline_samples.append(current_ear)
@@ -159,6 +446,18 @@ class EyeTracker:
                 baseline_ear = np.mean(self._ear_baseline_samples)
                 self.blink_threshold = baseline_ear * 0.6
                 print(f"Blink threshold: {self.blink_threshold:.3f}")
+                self._ear_baseline_done = True
+                self._ear_baseline_samples = []
+    
+    def _update_screen_mapping(self):
+        """Precompute the uncalibrated face -> screen scale and offset
+        
+        Call whenever screen_margin_x / screen_margin_y change.
+        """
+        self._map_scale_x = self.screen_w / (1 - 2 * self.screen_margin_x)
+        self._map_scale_y = self.screen_h / (1 - 2 * self.screen_margin_y)
+        self._map_offset_x = -self.screen_margin_x * self._map_scale_x
+        self._map_offset_y = -self.screen_margin_y * self._map_scale_y
     
     def map_to_screen(self, face_x, face_y):
         """
@@ -167,54 +466,66 @@ class EyeTracker:
         """
         if self.is_calibrated:
             # Use calibrated mapping
-            face_pos = np.array([[face_x, face_y]])
-            screen_coords = self.calibration.apply_calibration(face_pos)
-            screen_x = int(screen_coords[0, 0])
-            screen_y = int(screen_coords[0, 1])
-        else:
-            # Fallback to simple mapping with margins
-            margin_x = 0.25
-            margin_y = 0.20
-            
-            norm_x = (face_x - margin_x) / (1 - 2 * margin_x)
-            norm_y = (face_y - margin_y) / (1 - 2 * margin_y)
-            
-            norm_x = max(0, min(1, norm_x))
-            norm_y = max(0, min(1, norm_y))
-            
-            screen_x = int(norm_x * self.screen_w)
-            screen_y = int(norm_y * self.screen_h)
+            screen_x, screen_y = self.calibration.apply_calibration_point(face_x, face_y)
+            return int(screen_x), int(screen_y)
+        
+        # Fallback to simple mapping with margins, clamped to the screen
+        screen_x = face_x * self._map_scale_x + self._map_offset_x
+        screen_y = face_y * self._map_scale_y + self._map_offset_y
+        w, h = self.screen_w, self.screen_h
+        screen_x = 0 if screen_x < 0 else (w if screen_x > w else int(screen_x))
+        screen_y = 0 if screen_y < 0 else (h if screen_y > h else int(screen_y))
         
         return screen_x, screen_y
     
     def smooth_gaze(self, x, y):
         """
-        Apply HEAVY smoothing for stable cursor
-        Uses larger buffer for smoother movement
-        """
-        self.gaze_buffer_x.append(x)
-        self.gaze_buffer_y.append(y)
-        
-        # Use weighted average (recent positions weighted more)
-        weights = np.linspace(0.5, 1.0, len(self.gaze_buffer_x))
+        Smooth the mapped screen position with the Kalman filter
         
-        smooth_x = int(np.average(self.gaze_buffer_x, weights=weights))
-        smooth_y = int(np.average(self.gaze_buffer_y, weights=weights))
+        Tracks position and velocity per axis, so it lags far less than a
+        moving average for the same steadiness.
+        """
+        if self._kalman_x is None:
+            # First measurement: start at rest, position uncertainty = r
+            r = self.kalman_r
+            self._kalman_x = [float(x), 0.0, r, 0.0, r]
+            self._kalman_y = [float(y), 0.0, r, 0.0, r]
+            return x, y
         
-        return smooth_x, smooth_y
+        smooth_x = _kalman_step(self._kalman_x, self.kalman_q[0], self.kalman_r, x)
+        smooth_y = _kalman_step(self._kalman_y, self.kalman_q[1], self.kalman_r, y)
+        return self._clamp_to_screen(smooth_x, smooth_y)
+    
+    def predict_gaze(self):
+        """Advance the Kalman filter one frame without a measurement"""
+        smooth_x = _kalman_step(self._kalman_x, self.kalman_q[0], self.kalman_r)
+        smooth_y = _kalman_step(self._kalman_y, self.kalman_q[1], self.kalman_r)
+        return self._clamp_to_screen(smooth_x, smooth_y)
+    
+    def _clamp_to_screen(self, x, y):
+        """Round a filtered position to pixels inside the screen"""
+        w, h = self.screen_w, self.screen_h
+        x = 0 if x < 0 else (w if x > w else int(x))
+        y = 0 if y < 0 else (h if y > h else int(y))
+        return x, y
     
     def move_cursor_fast(self, x, y):
         """Fast cursor movement"""
         if self.use_quartz:
             try:
-                mouse_event = self.CGEventCreateMouseEvent(
-                    self.event_source, self.kCGEventMouseMoved, (x, y), 0
-                )
-                self.CGEventPost(self.kCGHIDEventTap, mouse_event)
+                self.CGEventSetLocation(self._mouse_event, (x, y))
+                self.CGEventPost(self.kCGHIDEventTap, self._mouse_event)
                 return True
             except:
                 self.use_quartz = False
         
+        if self._native_move is not None:
+            try:
+                self._native_move(x, y)
+                return True
+            except Exception:
+                self._native_move = None
+        
         try:
             pyautogui.moveTo(x, y, duration=0, _pause=False)
             return True
@@ -223,28 +534,43 @@ class EyeTracker:
     
     def detect_blink(self, ear_left, ear_right):
         """Detect blink"""
+        # A blink during the click cooldown could not click anyway
+        if time.monotonic() - self.last_click_time < self.click_cooldown:
+            self.blink_counter = 0
+            return False
+        
         avg_ear = (ear_left + ear_right) / 2.0
         
         if avg_ear < self.blink_threshold:
             self.blink_counter += 1
         else:
-            if self.blink_counter >= self.blink_frames_required:
+            # blink_frames_required is in camera frames; EAR is only sampled
+            # on inference frames
+            if self.blink_counter * self.inference_every >= self.blink_frames_required:
                 self.blink_counter = 0
                 return True
             self.blink_counter = 0
         
         return False
     
-    def perform_click(self):
-        """Perform click with safety checks"""
-        current_time = time.time()
+    def perform_click(self, x=None, y=None):
+        """
+        Perform click with safety checks
+        
+        Args:
+            x, y: Where the cursor is, if already known; otherwise it is
+                  queried from the system
+        """
+        current_time = time.monotonic()
         
         # Check cooldown
         if current_time - self.last_click_time < self.click_cooldown:
             return False
         
         try:
-            current_x, current_y = pyautogui.position()
+            if x is None:
+                x, y = pyautogui.position()
+            current_x, current_y = x, y
             
             # Safety check: avoid window controls
             if current_y < self.safe_zone_margin:
@@ -264,77 +590,213 @@ class EyeTracker:
             print(f"Click error: {e}")
             return False
     
-    def play_click_sound(self):
-        """Play click sound"""
+    def play_click_sound(self, x, y):
+        """Play click sound and log the click at (x, y)"""
         if not self.audio_feedback:
             return
         
         if self.use_sound_effects:
-            try:
-                subprocess.Popen(['afplay', self.sound_click], 
-                               stdout=subprocess.DEVNULL, 
-                               stderr=subprocess.DEVNULL)
-            except:
-                print('\a')
+            self._queue_sound(self.sound_click, bell=True)
         else:
             print('\a')
         
-        current_pos = pyautogui.position()
-        print(f"🖱️ CLICK #{self.click_count} at ({current_pos[0]}, {current_pos[1]})")
+        print(f"🖱️ CLICK #{self.click_count} at ({x}, {y})")
     
     def play_error_sound(self):
         """Play error sound"""
         if self.use_sound_effects:
+            self._queue_sound(self.sound_error, bell=False)
+    
+    def _queue_sound(self, path, bell):
+        """Hand a sound to the worker; dropped if it is already backed up"""
+        try:
+            self._sound_queue.put_nowait((path, bell))
+        except queue.Full:
+            pass
+    
+    def _sound_loop(self):
+        """Sound thread: play queued sounds one at a time"""
+        while True:
+            path, bell = self._sound_queue.get()
             try:
-                subprocess.Popen(['afplay', self.sound_error], 
-                               stdout=subprocess.DEVNULL, 
+                subprocess.run(['afplay', path],
+                               stdout=subprocess.DEVNULL,
                                stderr=subprocess.DEVNULL)
-            except:
-                pass
+            except OSError:
+                if bell:
+                    print('\a')
     
     def calculate_fps(self):
-        """Calculate FPS"""
-        current_time = time.time()
-        fps = 1 / (current_time - self.prev_time + 0.0001)
+        """Calculate FPS from an exponential moving average of frame time"""
+        current_time = time.perf_counter()
+        self._frame_time_ema += 0.1 * (current_time - self.prev_time - self._frame_time_ema)
         self.prev_time = current_time
-        return int(fps)
+        return int(1 / (self._frame_time_ema + 0.0001))
     
-    def run(self, show_debug=True):
-        """Main tracking loop"""
-        print("\nStarting Eye Tracker...")
-        print("\nCONTROLS:")
-        print("  Q - Quit")
-        print("  C - Toggle cursor control")
-        print("  K - Toggle click on blink")
-        print("  A - Toggle audio feedback")
-        print("  D - Toggle debug text")
-        print('  R - Run calibration (improves accuracy)') 
-        print("  L - Reload calibration")
-        print("  + - Decrease sensitivity (larger head movements)")
-        print("  - - Increase sensitivity (smaller head movements)")
-        print("-" * 50)
+    @staticmethod
+    def _put_latest(q, item):
+        """Replace whatever is waiting in a maxsize=1 queue with `item`
         
-        cursor_control_enabled = True
-        show_text_debug = True
+        Returns:
+            The item that was dropped, or None
+        """
+        try:
+            dropped = q.get_nowait()
+        except queue.Empty:
+            dropped = None
+        q.put_nowait(item)
+        return dropped
+    
+    def _acquire_buffers(self):
+        """Get a (frame, small rgb) buffer pair from the pool, allocating if it is empty"""
+        try:
+            return self._buffer_pool.get_nowait()
+        except queue.Empty:
+            infer_w, infer_h = self.inference_size
+            return (np.empty((self.cam_h, self.cam_w, 3), np.uint8),
+                    np.empty((infer_h, infer_w, 3), np.uint8))
+    
+    def _release_buffers(self, buffers):
+        """Return a (frame, rgb) buffer pair to the pool"""
+        # The OpenCL path downloads into fresh arrays and never draws from the pool
+        if not self.use_opencl:
+            self._buffer_pool.put(buffers)
+    
+    def _start_pipeline(self):
+        """Start the capture and inference threads"""
+        self._last_tracking = None
+        self._stop_event = threading.Event()
+        self._capture_queue = queue.Queue(maxsize=1)
+        self._ui_queue = queue.Queue(maxsize=1)
+        self._pipeline_threads = [
+            threading.Thread(target=self._run_stage, args=(self._capture_loop,), daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._inference_loop,), daemon=True),
+        ]
+        for thread in self._pipeline_threads:
+            thread.start()
+    
+    def _handle_stop_signal(self, signum, frame):
+        """
+        SIGINT/SIGTERM handler for run(): stops the pipeline, or interrupts
+        calibration, whose own loop never looks at the stop event
+        """
+        self._stop_event.set()
+        if self._calibrating:
+            raise KeyboardInterrupt
+    
+    def _run_stage(self, loop):
+        """
+        Run a pipeline thread's loop; if it raises, keep the exception for
+        run() and stop the pipeline rather than dying silently
+        """
+        stop_event = self._stop_event
+        try:
+            loop()
+        except Exception as e:
+            if self.pipeline_error is None:
+                self.pipeline_error = e
+        finally:
+            stop_event.set()
+    
+    def _stop_pipeline(self):
+        """Stop the capture and inference threads and wait for them"""
+        self._stop_event.set()
+        for thread in self._pipeline_threads:
+            thread.join()
+        self._pipeline_threads = []
+    
+    def _capture_loop(self):
+        """Capture thread: read, mirror and convert frames for inference
         
-        while True:
-            self._frame_count += 1
-            
-            ret, frame = self.cam.read()
+        OpenCV capture is not thread-safe, so self.cam is only touched here
+        while the pipeline is running. Frames are grab()bed continuously so
+        the driver queue never backs up, but only retrieve()d (decoded) when
+        inference has taken the previous one - it always gets the newest frame.
+        """
+        # Loop invariants, bound once per pipeline start
+        cam = self.cam
+        stop_event = self._stop_event
+        capture_queue = self._capture_queue
+        inference_size = self.inference_size
+        
+        raw = None
+        infer_w, infer_h = inference_size
+        small = np.empty((infer_h, infer_w, 3), np.uint8)
+        while not stop_event.is_set():
+            ret = cam.grab()
+            if ret and not capture_queue.empty():
+                continue
+            if ret:
+                ret, raw = cam.retrieve(raw)
             if not ret:
+                self.camera_failed = True
+                stop_event.set()
                 break
             
-            frame = cv2.flip(frame, 1)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.face_mesh.process(rgb_frame)
+            if self.use_opencl:
+                # T-API: transform on the OpenCL device, download the two results
+                flipped = cv2.flip(cv2.UMat(raw), 1)
+                small_rgb = cv2.cvtColor(
+                    cv2.resize(flipped, inference_size, interpolation=cv2.INTER_AREA),
+                    cv2.COLOR_BGR2RGB
+                )
+                frame, rgb_frame = flipped.get(), small_rgb.get()
+            else:
+                # Write into pooled buffers instead of allocating two frames each time
+                frame, rgb_frame = self._acquire_buffers()
+                frame = cv2.flip(raw, 1, dst=frame)
+                small = cv2.resize(frame, inference_size, dst=small, interpolation=cv2.INTER_AREA)
+                rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+            dropped = self._put_latest(capture_queue, (frame, rgb_frame))
+            if dropped is not None:
+                self._release_buffers(dropped)
+    
+    def _inference_loop(self):
+        """Inference thread: face mesh, cursor movement and blink clicks"""
+        # Loop invariants, bound once per pipeline start
+        stop_event = self._stop_event
+        capture_queue = self._capture_queue
+        ui_queue = self._ui_queue
+        process = self.face_mesh.process
+        
+        while not stop_event.is_set():
+            try:
+                buffers = capture_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            rgb_frame = buffers[1]
+            
+            self._frame_count += 1
             fps = self.calculate_fps()
+            tracking = None
+            
+            if self._frame_count % self.inference_every and self._last_tracking is not None:
+                # Skipped frame: the cursor follows the filter's prediction;
+                # blink detection waits for the next real sample
+                points, face_x, face_y, _, _, avg_ear = self._last_tracking
+                smooth_x, smooth_y = self.predict_gaze()
+                
+                if self.cursor_control_enabled and self._frame_count % 3 == 0:
+                    self.move_cursor_fast(smooth_x, smooth_y)
+                
+                tracking = (points, face_x, face_y, smooth_x, smooth_y, avg_ear)
+                dropped = self._put_latest(ui_queue, (buffers, fps, tracking))
+                if dropped is not None:
+                    self._release_buffers(dropped[0])
+                continue
+            
+            # Read-only lets MediaPipe take the frame by reference instead of
+            # copying it; writable again so the buffer can be pooled
+            rgb_frame.flags.writeable = False
+            results = process(rgb_frame)
+            rgb_frame.flags.writeable = True
             
             if results.multi_face_landmarks:
                 face_landmarks = results.multi_face_landmarks[0]
-                landmarks = face_landmarks.landmark
+                points = self.landmarks_to_array(face_landmarks.landmark)
                 
                 # Get face position
-                face_x, face_y = self.get_face_position(landmarks)
+                face_x, face_y = self.get_face_position(points)
                 
                 # Map to screen
                 screen_x, screen_y = self.map_to_screen(face_x, face_y)
@@ -342,126 +804,247 @@ class EyeTracker:
                 # Smooth
                 smooth_x, smooth_y = self.smooth_gaze(screen_x, screen_y)
                 
-                # Move cursor (every 2nd frame)
-                if cursor_control_enabled and self._frame_count % 3 == 0:
+                # Move cursor (every 3rd frame)
+                if self.cursor_control_enabled and self._frame_count % 3 == 0:
                     self.move_cursor_fast(smooth_x, smooth_y)
                 
                 # Blink detection
-                ear_right = self.calculate_ear(landmarks, self.RIGHT_EYE)
-                ear_left = self.calculate_ear(landmarks, self.LEFT_EYE)
+                ear_right, ear_left = self.calculate_ears(points)
                 avg_ear = (ear_left + ear_right) / 2.0
                 
                 self.adjust_blink_threshold(avg_ear)
                 
                 if self.detect_blink(ear_left, ear_right):
                     if self.click_enabled:
-                        if self.perform_click():
-                            self.play_click_sound()
+                        # Under head control the cursor is where we put it;
+                        # otherwise the user moved it and it must be queried
+                        if self.cursor_control_enabled:
+                            click_x, click_y = smooth_x, smooth_y
+                        else:
+                            click_x, click_y = pyautogui.position()
+                        if self.perform_click(click_x, click_y):
+                            self.play_click_sound(click_x, click_y)
                     else:
                         print("BLINK! (clicking disabled)")
                 
-                # Draw debug info
-                if show_debug:
-                    # Draw nose
-                    nose = landmarks[self.NOSE_TIP]
-                    nose_x = int(nose.x * self.cam_w)
-                    nose_y = int(nose.y * self.cam_h)
-                    cv2.circle(frame, (nose_x, nose_y), 5, (255, 0, 0), -1)
-                    
-                    # Draw eyes
-                    for eye_idx in self.RIGHT_EYE + self.LEFT_EYE:
-                        landmark = landmarks[eye_idx]
-                        x = int(landmark.x * self.cam_w)
-                        y = int(landmark.y * self.cam_h)
-                        cv2.circle(frame, (x, y), 2, (0, 255, 0), -1)
-                    
-                    if show_text_debug:
-                        cv2.putText(frame, f"FPS: {fps}", (10, 30),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                        cv2.putText(frame, f"Face: ({face_x:.2f}, {face_y:.2f})", (10, 60),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                        cv2.putText(frame, f"Screen: ({smooth_x}, {smooth_y})", (10, 90),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                        cv2.putText(frame, f"EAR: {avg_ear:.3f}", (10, 120),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                        cv2.putText(frame, f"Cursor: {'ON' if cursor_control_enabled else 'OFF'}", (10, 150),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, 
-                                   (0, 255, 0) if cursor_control_enabled else (0, 0, 255), 2)
-                        cv2.putText(frame, f"Click: {'ON' if self.click_enabled else 'OFF'} (#{self.click_count})", (10, 180),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, 
-                                   (0, 255, 0) if self.click_enabled else (0, 0, 255), 2)
-                        cv2.putText(frame, f"Sensitivity: {self.screen_margin_x:.2f}", (10, 210),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                        cv2.putText(frame, f"Calibrated: {'YES' if self.is_calibrated else 'NO'}", (10, 210),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, 
-                                    (0, 255, 0) if self.is_calibrated else (0, 165, 255), 2)
+                tracking = (points, face_x, face_y, smooth_x, smooth_y, avg_ear)
             
-            else:
-                if show_debug:
-                    cv2.putText(frame, "NO FACE DETECTED", (10, 30),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-                    cv2.putText(frame, f"FPS: {fps}", (10, 60),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            self._last_tracking = tracking
+            dropped = self._put_latest(ui_queue, (buffers, fps, tracking))
+            if dropped is not None:
+                self._release_buffers(dropped[0])
+    
+    def _debug_labels(self, colors):
+        """
+        Render the DEBUG_LABELS column once per color combination
+        
+        Returns:
+            (image, mask, value_x) - mask marks the label pixels, value_x[i]
+            is where line i's value starts
+        """
+        cached = self._debug_label_cache.get(colors)
+        if cached is None:
+            font = cv2.FONT_HERSHEY_SIMPLEX
+            widths = [cv2.getTextSize(label, font, scale, 2)[0][0]
+                      for label, _, scale in self.DEBUG_LABELS]
+            # Pen advance after each label (getTextSize pads for thickness,
+            # which cancels out in the difference)
+            advances = [cv2.getTextSize(label + "0", font, scale, 2)[0][0]
+                        - cv2.getTextSize("0", font, scale, 2)[0][0]
+                        for label, _, scale in self.DEBUG_LABELS]
+            height = self.DEBUG_LABELS[-1][1] + 10
+            image = np.zeros((height, 10 + max(widths), 3), np.uint8)
+            for (label, y, scale), color in zip(self.DEBUG_LABELS, colors):
+                cv2.putText(image, label, (10, y), font, scale, color, 2)
+            mask = image.any(axis=2, keepdims=True)
+            cached = (image, mask, [10 + a for a in advances])
+            self._debug_label_cache[colors] = cached
+        return cached
+    
+    def draw_debug(self, frame, fps, tracking, show_text_debug):
+        """Draw landmarks and status text onto the preview frame"""
+        if tracking is None:
+            cv2.putText(frame, "NO FACE DETECTED", (10, 30),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+            cv2.putText(frame, f"FPS: {fps}", (10, 60),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            return
+        
+        points, face_x, face_y, smooth_x, smooth_y, avg_ear = tracking
+        cursor_control_enabled = self.cursor_control_enabled
+        
+        # Landmarks to preview pixels in one multiply: column 0 is the nose
+        px = (points * self._cam_scale).T.astype(np.int32)
+        
+        # Draw nose
+        nose_x, nose_y = px[0].tolist()
+        cv2.circle(frame, (nose_x, nose_y), 5, (255, 0, 0), -1)
+        
+        # Draw eyes: zero-length thick segments render the same dots as
+        # cv2.circle(r=2), but in one call
+        cv2.polylines(frame, np.repeat(px[1:, None], 2, axis=1), False, (0, 255, 0), 4)
+        
+        if show_text_debug:
+            green = (0, 255, 0)
+            colors = (
+                green, green, green, green,
+                green if cursor_control_enabled else (0, 0, 255),
+                green if self.click_enabled else (0, 0, 255),
+                green,
+                green if self.is_calibrated else (0, 165, 255),
+            )
+            values = (
+                f" {fps}",
+                f" ({face_x:.2f}, {face_y:.2f})",
+                f" ({smooth_x}, {smooth_y})",
+                f" {avg_ear:.3f}",
+                f" {'ON' if cursor_control_enabled else 'OFF'}",
+                f" {'ON' if self.click_enabled else 'OFF'} (#{self.click_count})",
+                f" {self.screen_margin_x:.2f}",
+                f" {'YES' if self.is_calibrated else 'NO'}",
+            )
             
-            if show_debug:
-                cv2.imshow('Eye Tracker - BlinkOS (Day 3)', frame)
+            # Blit the cached labels, then rasterize only the changing values
+            labels, mask, value_x = self._debug_labels(colors)
+            h, w = labels.shape[:2]
+            np.copyto(frame[:h, :w], labels, where=mask)
+            for (_, y, scale), x, value, color in zip(self.DEBUG_LABELS, value_x, values, colors):
+                cv2.putText(frame, value, (x, y), cv2.FONT_HERSHEY_SIMPLEX, scale, color, 2)
+    
+    def run(self, show_debug=True):
+        """Main tracking loop
+        
+        Capture and inference run on their own threads (see _start_pipeline);
+        this thread only renders the newest result and handles keys.
+        """
+        print("\nStarting Eye Tracker...")
+        print("\nCONTROLS:")
+        print("  Q - Quit")
+        print("  C - Toggle cursor control")
+        print("  K - Toggle click on blink")
+        print("  A - Toggle audio feedback")
+        print("  D - Toggle debug text")
+        print('  R - Run calibration (improves accuracy)') 
+        print("  L - Reload calibration")
+        print("  + - Decrease sensitivity (larger head movements)")
+        print("  - - Increase sensitivity (smaller head movements)")
+        print("-" * 50)
+        
+        self.cursor_control_enabled = True
+        self.camera_failed = False
+        self.pipeline_error = None
+        show_text_debug = True
+        # Preview is capped at ~30 FPS; tracking keeps running at full rate
+        draw_interval = 1.0 / 30
+        last_draw = 0.0
+        
+        # Ctrl+C / terminate() end the loop normally so the camera is
+        # released - the only way out when there is no window to press Q in.
+        # The previous handlers are put back once run() returns
+        previous_handlers = {}
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                previous_handlers[sig] = signal.signal(sig, self._handle_stop_signal)
+            except ValueError:
+                pass  # run() is not on the main thread
+        
+        try:
+            self._start_pipeline()
+        
+            while not self._stop_event.is_set():
+                try:
+                    buffers, fps, tracking = self._ui_queue.get(timeout=0.05)
+                except queue.Empty:
+                    buffers = None
             
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q') or key == ord('Q'):
-                print("\nStopping...")
-                break
-            elif key == ord('c') or key == ord('C'):
-                cursor_control_enabled = not cursor_control_enabled
-                print(f"Cursor: {'ON' if cursor_control_enabled else 'OFF'}")
-            elif key == ord('k') or key == ord('K'):
-                self.click_enabled = not self.click_enabled
-                print(f"Click on blink: {'ENABLED' if self.click_enabled else 'DISABLED'}")
-            elif key == ord('a') or key == ord('A'):
-                self.audio_feedback = not self.audio_feedback
-                print(f"Audio: {'ON' if self.audio_feedback else 'OFF'}")
-            elif key == ord('d') or key == ord('D'):
-                show_text_debug = not show_text_debug
-            # ADD THESE NEW KEYS:
-            elif key == ord('r') or key == ord('R'):
-                # Run calibration
-                print("\nStarting calibration...")
-                cv2.destroyWindow('Eye Tracker - BlinkOS (Day 3)')
-                success = self.calibration.run_calibration(self.face_mesh, self.cam)
-                if success:
-                    self.is_calibrated = True
-                    print("Calibration complete - cursor control improved!")
-                else:
-                    print("Calibration failed - continuing with previous settings")
-            elif key == ord('l') or key == ord('L'):
-                # Reload calibration
-                self.is_calibrated = self.calibration.load_calibration()
-                if self.is_calibrated:
-                    print("Calibration reloaded")
-                else:
-                    print("NNo calibration file found")
-            elif key == ord('+') or key == ord('='):
-                # Only relevant if not calibrated
-                if not self.is_calibrated:
-                    self.screen_margin_x = max(0.1, self.screen_margin_x - 0.05)
-                    self.screen_margin_y = max(0.1, self.screen_margin_y - 0.05)
-                    print(f"Sensitivity increased: {self.screen_margin_x:.2f}")
-                else:
-                    print("Using calibrated mode - sensitivity adjustment not needed")
-            elif key == ord('-') or key == ord('_'):
-                # Only relevant if not calibrated
-                if not self.is_calibrated:
-                    self.screen_margin_x = min(0.4, self.screen_margin_x + 0.05)
-                    self.screen_margin_y = min(0.4, self.screen_margin_y + 0.05)
-                    print(f"Sensitivity decreased: {self.screen_margin_x:.2f}")
-                else:
-                    print("Using calibrated mode - sensitivity adjustment not needed")
-                        
-        self.cam.release()
-        cv2.destroyAllWindows()
+                if buffers is not None:
+                    now = time.perf_counter()
+                    if show_debug and now - last_draw >= draw_interval:
+                        last_draw = now
+                        frame = buffers[0]
+                        self.draw_debug(frame, fps, tracking, show_text_debug)
+                        cv2.imshow('Eye Tracker - BlinkOS (Day 3)', frame)
+                    # imshow copies the image, so the buffers can be reused now
+                    self._release_buffers(buffers)
+            
+                # pollKey returns at once (waitKey(1) sleeps); without a preview
+                # window there are no keys to read at all
+                key = (cv2.pollKey() & 0xFF) if show_debug else 0xFF
+                if key == ord('q') or key == ord('Q'):
+                    print("\nStopping...")
+                    break
+                elif key == ord('c') or key == ord('C'):
+                    self.cursor_control_enabled = not self.cursor_control_enabled
+                    print(f"Cursor: {'ON' if self.cursor_control_enabled else 'OFF'}")
+                elif key == ord('k') or key == ord('K'):
+                    self.click_enabled = not self.click_enabled
+                    print(f"Click on blink: {'ENABLED' if self.click_enabled else 'DISABLED'}")
+                elif key == ord('a') or key == ord('A'):
+                    self.audio_feedback = not self.audio_feedback
+                    print(f"Audio: {'ON' if self.audio_feedback else 'OFF'}")
+                elif key == ord('d') or key == ord('D'):
+                    show_text_debug = not show_text_debug
+                # ADD THESE NEW KEYS:
+                elif key == ord('r') or key == ord('R'):
+                    # Run calibration (it drives the camera and face mesh itself)
+                    print("\nStarting calibration...")
+                    self._stop_pipeline()
+                    cv2.destroyWindow('Eye Tracker - BlinkOS (Day 3)')
+                    self._calibrating = True
+                    try:
+                        success = self.calibration.run_calibration(self.face_mesh, self.cam)
+                    finally:
+                        self._calibrating = False
+                    if success:
+                        self.is_calibrated = True
+                        print("Calibration complete - cursor control improved!")
+                    else:
+                        print("Calibration failed - continuing with previous settings")
+                    self._start_pipeline()
+                elif key == ord('l') or key == ord('L'):
+                    # Reload calibration
+                    self.is_calibrated = self.calibration.load_calibration()
+                    if self.is_calibrated:
+                        print("Calibration reloaded")
+                    else:
+                        print("NNo calibration file found")
+                elif key == ord('+') or key == ord('='):
+                    # Only relevant if not calibrated
+                    if not self.is_calibrated:
+                        self.screen_margin_x = max(0.1, self.screen_margin_x - 0.05)
+                        self.screen_margin_y = max(0.1, self.screen_margin_y - 0.05)
+                        self._update_screen_mapping()
+                        print(f"Sensitivity increased: {self.screen_margin_x:.2f}")
+                    else:
+                        print("Using calibrated mode - sensitivity adjustment not needed")
+                elif key == ord('-') or key == ord('_'):
+                    # Only relevant if not calibrated
+                    if not self.is_calibrated:
+                        self.screen_margin_x = min(0.4, self.screen_margin_x + 0.05)
+                        self.screen_margin_y = min(0.4, self.screen_margin_y + 0.05)
+                        self._update_screen_mapping()
+                        print(f"Sensitivity decreased: {self.screen_margin_x:.2f}")
+                    else:
+                        print("Using calibrated mode - sensitivity adjustment not needed")
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+            self._stop_pipeline()
+            self.cam.release()
+            cv2.destroyAllWindows()
+        
+        if self.camera_failed:
+            print("Camera stopped delivering frames")
         print("Stopped")
+        
+        if self.pipeline_error is not None:
+            raise self.pipeline_error
     
     def __del__(self):
         """Cleanup"""
+        # The capture thread must be done with the camera before it is released
+        if getattr(self, '_pipeline_threads', None):
+            self._stop_pipeline()
         if hasattr(self, 'cam') and self.cam.isOpened():
             self.cam.release()
         cv2.destroyAllWindows()
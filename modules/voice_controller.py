@@ -10,6 +10,40 @@ import subprocess
 import os
 import time
 import threading
+import queue
+import json
+from pathlib import Path
+from urllib.parse import quote
+
+try:
+    from Foundation import NSAppleScript
+except ImportError:
+    NSAppleScript = None
+
+try:
+    from AppKit import NSWorkspace, NSPasteboard, NSPasteboardTypeString
+except ImportError:
+    NSWorkspace = NSPasteboard = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzzy_process
+except ImportError:
+    fuzzy_process = None
+
+try:
+    import vosk
+except ImportError:
+    vosk = None
+
+try:
+    import Quartz
+except ImportError:
+    Quartz = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
 
 
 class VoiceController:
@@ -18,6 +52,39 @@ class VoiceController:
     Recognizes commands and executes system actions
     """
     
+    # Optional offline model; commands are recognized on-device when present
+    VOSK_MODEL = Path(__file__).parent.parent / 'data' / 'vosk-model-small-en-us'
+    
+    # Ambient-noise threshold from the last calibration, reused for a day
+    NOISE_CALIBRATION_FILE = Path(__file__).parent.parent / 'data' / 'voice_calibration.json'
+    NOISE_CALIBRATION_MAX_AGE = 24 * 60 * 60
+    
+    # Phrases run() handles itself, outside the commands table
+    CONTROL_PHRASES = ['exit', 'quit voice', 'stop listening', 'help', 'list commands']
+    
+    # Sections of the 'help' listing
+    HELP_SECTIONS = [
+        ("Applications", ['open safari', 'open chrome', 'open notes', 'open terminal', 'open mail', 'open finder']),
+        ("Window Management", ['close window', 'new tab', 'minimize', 'maximize', 'quit app']),
+        (" Navigation", ['scroll down', 'scroll up', 'go back', 'go forward', 'refresh']),
+        (" System", ['volume up', 'volume down', 'mute', 'take screenshot']),
+        (" Dictation", ['type / start typing (then speak to type)', 'stop typing (to exit)']),
+        (" Search", ['search [query]', 'google [query]']),
+    ]
+    
+    # Pasteboard types dictation may overwrite and restore; anything else
+    # on the clipboard makes it type instead
+    PLAIN_TEXT_TYPES = {'public.utf8-plain-text', 'NSStringPboardType'}
+    
+    # Virtual key codes (ANSI layout) for the shortcut keys used below
+    KEY_CODES = {
+        'f': 3, 'v': 9, 'q': 12, 'w': 13, 'r': 15, 't': 17, '3': 20,
+        ']': 30, '[': 33, 'n': 45, 'm': 46, 'tab': 48, '`': 50,
+    }
+    KEY_DOWN_ARROW, KEY_UP_ARROW = 125, 126
+    KEY_PAGE_DOWN, KEY_PAGE_UP = 121, 116
+    KEY_BRIGHTNESS_UP, KEY_BRIGHTNESS_DOWN = 144, 145
+    
     def __init__(self):
         """Initialize voice controller"""
         print("Initializing Voice Controller...")
@@ -27,21 +94,27 @@ class VoiceController:
         
         # List available microphones and let the user choose 
         self.select_microphone()         
-        # Adjust for ambient noise
-        print("Calibrating microphone for ambient noise...")
-        with self.microphone as source:
-            self.recognizer.adjust_for_ambient_noise(source, duration=1)
+        # Adjust for ambient noise, unless this microphone was calibrated
+        # recently; it records for a second, so the rest of setup runs meanwhile
+        noise_thread = None
+        noise_errors = []
+        if not self.load_noise_calibration():
+            def calibrate():
+                try:
+                    self.calibrate_ambient_noise()
+                except Exception as e:
+                    noise_errors.append(e)
+            noise_thread = threading.Thread(target=calibrate)
+            noise_thread.start()
         
-        # Text-to-speech for feedback
-        try:
-            self.engine = pyttsx3.init()
-            self.engine.setProperty('rate', 180)
-            self.engine.setProperty('volume', 0.8)
-            self.tts_enabled = True
-            print("Text-to-speech enabled")
-        except Exception as e:
-            print(f"TTS initialization failed: {e}")
-            self.tts_enabled = False
+        # Text-to-speech for feedback. pyttsx3 isn't thread-safe, so one
+        # worker creates the engine and speaks queued (text, done_event)
+        # pairs in order; wait until it reports whether TTS is available
+        self.tts_enabled = False
+        self._speech_queue = queue.Queue(maxsize=4)
+        tts_ready = threading.Event()
+        threading.Thread(target=self._speech_loop, args=(tts_ready,), daemon=True).start()
+        tts_ready.wait()
         
         # Command mapping
         self.commands = {
@@ -105,9 +178,32 @@ class VoiceController:
             'search': self.search_google,
             'google': self.search_google,
         }
+        # 'help' output, built once
+        help_lines = ["", "Available Commands:"]
+        for title, entries in self.HELP_SECTIONS:
+            help_lines += ["", f"{title}:"] + [f"  - {entry}" for entry in entries]
+        help_lines.append("")
+        self._help_text = "\n".join(help_lines)
+        
+        self._index_commands()
+        self.vosk_recognizer = self._create_vosk_recognizer()
+        
+        # Local voice activity check before audio is sent to Google; phrases
+        # with speech in fewer than min_speech_ratio of 30 ms frames are dropped
+        self.vad = webrtcvad.Vad(2) if webrtcvad is not None else None
+        self.min_speech_ratio = 0.1
+        
+        # Misheard utterances ("clothes window") scoring above this (0-100)
+        # against a command phrase run that command; needs rapidfuzz
+        self.fuzzy_match_threshold = 80
         
         # State
         self.dictation_mode = False
+        # After a bare "search", a phrase finishing before this monotonic
+        # deadline is the query (3 s to start speaking + 5 s phrase limit)
+        self.search_query_timeout = 8.0
+        self._search_deadline = None
+        self._search_lock = threading.Lock()
         self.is_listening = False
         self.command_count = 0
         self.last_command = None
@@ -115,6 +211,29 @@ class VoiceController:
         # Audio feedback toggle
         self.audio_feedback = True
         
+        # Compiled NSAppleScript objects, keyed by source
+        self._applescripts = {}
+        
+        if Quartz is not None:
+            self._modifier_flags = {
+                'command': Quartz.kCGEventFlagMaskCommand,
+                'shift': Quartz.kCGEventFlagMaskShift,
+                'control': Quartz.kCGEventFlagMaskControl,
+                'option': Quartz.kCGEventFlagMaskAlternate,
+            }
+        
+        # Clipboard text held while dictation pastes, and its pending restore
+        self._saved_clipboard = None
+        self._clipboard_change_count = None
+        self._clipboard_restore = None
+        self._clipboard_lock = threading.Lock()
+        
+        if noise_thread is not None:
+            noise_thread.join()
+            if noise_errors:
+                # Fail like a calibration on this thread would have
+                raise noise_errors[0]
+        
         print("Voice Controller initialized!")
         print(f"{len(self.commands)} commands available")
     
@@ -140,13 +259,86 @@ class VoiceController:
                 print(f"\n Auto selected : {index} - {name}") 
                 break 
         if built_in_index is not None :
-            self.select_microphone = sr.Microphone(device_index = built_in_index) 
+            self.microphone = sr.Microphone(device_index = built_in_index) 
         else: 
             #Default to the first microphone 
             print(f"\n Using default microphone: 0 - {mic_list[0]}") 
-            self.select_microphone = sr.Microphone(device_index = 0) 
+            built_in_index = 0
+            self.microphone = sr.Microphone(device_index = 0) 
+        self.microphone_name = mic_list[built_in_index]
         print("\nTIP: if voice recognition is poor, then we need to edit the voice_controller.py and manually set device_index to your prefered microphone\n")              
     
+    def _index_commands(self):
+        """Build the phrase list process_command() searches utterances with"""
+        # Longest phrase first, so 'unmute' wins over 'mute' and
+        # 'quit application' over 'quit app'
+        self._command_phrases = sorted(self.commands, key=len, reverse=True)
+    
+    def _create_vosk_recognizer(self):
+        """
+        Create an offline recognizer restricted to the command phrases, if
+        vosk and its model are available
+        
+        Returns:
+            vosk.KaldiRecognizer, or None to use Google for everything
+        """
+        if vosk is None or not self.VOSK_MODEL.exists():
+            return None
+        
+        try:
+            vosk.SetLogLevel(-1)
+            model = vosk.Model(str(self.VOSK_MODEL))
+            # Anything outside the grammar decodes as [unk]
+            grammar = list(self.commands) + self.CONTROL_PHRASES + ['[unk]']
+            recognizer = vosk.KaldiRecognizer(model, 16000, json.dumps(grammar))
+            print("Using offline command recognition (Vosk)")
+            return recognizer
+        except Exception as e:
+            print(f"Vosk initialization failed: {e}")
+            return None
+    
+    def calibrate_ambient_noise(self):
+        """Measure the ambient noise level and save the energy threshold"""
+        print("Calibrating microphone for ambient noise...")
+        with self.microphone as source:
+            self.recognizer.adjust_for_ambient_noise(source, duration=1)
+        self.save_noise_calibration()
+    
+    def load_noise_calibration(self):
+        """
+        Reuse the saved energy threshold if it is recent and for this microphone
+        
+        Returns:
+            bool: True if the threshold was loaded
+        """
+        try:
+            with open(self.NOISE_CALIBRATION_FILE) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if saved.get('microphone') != self.microphone_name:
+            return False
+        if time.time() - saved.get('timestamp', 0) > self.NOISE_CALIBRATION_MAX_AGE:
+            return False
+        
+        self.recognizer.energy_threshold = saved['energy_threshold']
+        print(f"Using saved ambient noise calibration ({saved['energy_threshold']:.0f})")
+        return True
+    
+    def save_noise_calibration(self):
+        """Save the energy threshold found by adjust_for_ambient_noise"""
+        try:
+            self.NOISE_CALIBRATION_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.NOISE_CALIBRATION_FILE, 'w') as f:
+                json.dump({
+                    'microphone': self.microphone_name,
+                    'energy_threshold': self.recognizer.energy_threshold,
+                    'timestamp': time.time(),
+                }, f)
+        except OSError as e:
+            print(f"Could not save noise calibration: {e}")
+    
     def speak(self, text, blocking=False):
         """
         Text-to-speech output
@@ -158,51 +350,65 @@ class VoiceController:
         if not self.audio_feedback or not self.tts_enabled:
             return
         
+        done = threading.Event() if blocking else None
+        try:
+            self._speech_queue.put_nowait((text, done))
+        except queue.Full:
+            # Behind on feedback: drop the oldest phrase rather than lag further
+            try:
+                _, dropped_done = self._speech_queue.get_nowait()
+                if dropped_done is not None:
+                    # Release a blocking caller whose phrase was dropped
+                    dropped_done.set()
+            except queue.Empty:
+                pass
+            self._speech_queue.put((text, done))
+        
+        if done is not None:
+            done.wait()
+    
+    def _speech_loop(self, ready):
+        """
+        Speech thread: create the TTS engine, then say queued phrases one at a time
+        
+        Args:
+            ready: Event set once tts_enabled reflects whether init succeeded
+        """
         try:
-            if blocking:
+            self.engine = pyttsx3.init()
+            self.engine.setProperty('rate', 180)
+            self.engine.setProperty('volume', 0.8)
+            self.tts_enabled = True
+            print("Text-to-speech enabled")
+        except Exception as e:
+            print(f"TTS initialization failed: {e}")
+        finally:
+            ready.set()
+        
+        if not self.tts_enabled:
+            return
+        
+        while True:
+            text, done = self._speech_queue.get()
+            try:
                 self.engine.say(text)
                 self.engine.runAndWait()
-            else:
-                # Non-blocking speech
-                def speak_thread():
-                    self.engine.say(text)
-                    self.engine.runAndWait()
-                
-                threading.Thread(target=speak_thread, daemon=True).start()
-        except Exception as e:
-            print(f"TTS error: {e}")
+            except Exception as e:
+                print(f"TTS error: {e}")
+            if done is not None:
+                done.set()
     
-    def listen(self, timeout=5, phrase_time_limit=5):
+    def _transcribe(self, audio, free_form=False):
         """
-        Listen for voice input
+        Recognize audio, reporting failures instead of raising
         
-        Args:
-            timeout: Max time to wait for speech to start
-            phrase_time_limit: Max time for phrase
-            
         Returns:
             str: Recognized text or None
         """
-        if not self.is_listening:
-            return None
-        
         try:
-            with self.microphone as source:
-                print("🎤 Listening...")
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=timeout, 
-                    phrase_time_limit=phrase_time_limit
-                )
-            
-            # Recognize speech using Google
-            text = self.recognizer.recognize_google(audio).lower()
+            text = self._recognize(audio, free_form=free_form)
             print(f"Heard: '{text}'")
             return text
-            
-        except sr.WaitTimeoutError:
-            # No speech detected
-            return None
         except sr.UnknownValueError:
             print("Could not understand audio")
             return None
@@ -213,51 +419,102 @@ class VoiceController:
             print(f"Error: {e}")
             return None
     
+    def _recognize(self, audio, free_form=False):
+        """
+        Convert recorded audio to lower-case text
+        
+        Commands are decoded on-device when Vosk is available; dictation,
+        search queries and anything Vosk can't place go to Google.
+        
+        Args:
+            audio: sr.AudioData from the microphone
+            free_form: Skip the command-only offline recognizer
+            
+        Returns:
+            str: Recognized text
+        """
+        if self.vosk_recognizer is not None and not free_form:
+            self.vosk_recognizer.AcceptWaveform(
+                audio.get_raw_data(convert_rate=16000, convert_width=2)
+            )
+            text = json.loads(self.vosk_recognizer.FinalResult())['text']
+            if not text:
+                raise sr.UnknownValueError()
+            if '[unk]' not in text:
+                return text
+        
+        if self.vad is not None and not self._contains_speech(audio):
+            raise sr.UnknownValueError()
+        
+        # Recognize speech using Google
+        return self.recognizer.recognize_google(audio).lower()
+    
+    def _contains_speech(self, audio):
+        """
+        Check with the local VAD whether a phrase is worth sending to Google
+        
+        Args:
+            audio: sr.AudioData from the microphone
+            
+        Returns:
+            bool: True if enough 30 ms frames contain speech
+        """
+        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        frame_bytes = 480 * 2  # 30 ms of 16-bit mono at 16 kHz
+        frames = range(0, len(raw) - frame_bytes + 1, frame_bytes)
+        if not frames:
+            return True
+        
+        speech_frames = sum(
+            self.vad.is_speech(raw[i:i + frame_bytes], 16000) for i in frames
+        )
+        return speech_frames >= self.min_speech_ratio * len(frames)
+    
     # ==================== APPLICATION COMMANDS ====================
     
     def open_safari(self):
         """Open Safari browser"""
-        subprocess.Popen(['open', '-a', 'Safari'])
+        self._open_app('Safari')
         self.speak("Opening Safari")
     
     def open_chrome(self):
         """Open Google Chrome"""
-        subprocess.Popen(['open', '-a', 'Google Chrome'])
+        self._open_app('Google Chrome')
         self.speak("Opening Chrome")
     
     def open_firefox(self):
         """Open Firefox"""
-        subprocess.Popen(['open', '-a', 'Firefox'])
+        self._open_app('Firefox')
         self.speak("Opening Firefox")
     
     def open_notes(self):
         """Open Notes app"""
-        subprocess.Popen(['open', '-a', 'Notes'])
+        self._open_app('Notes')
         self.speak("Opening Notes")
     
     def open_terminal(self):
         """Open Terminal"""
-        subprocess.Popen(['open', '-a', 'Terminal'])
+        self._open_app('Terminal')
         self.speak("Opening Terminal")
     
     def open_mail(self):
         """Open Mail app"""
-        subprocess.Popen(['open', '-a', 'Mail'])
+        self._open_app('Mail')
         self.speak("Opening Mail")
     
     def open_finder(self):
         """Open Finder"""
-        subprocess.Popen(['open', '-a', 'Finder'])
+        self._open_app('Finder')
         self.speak("Opening Finder")
     
     def open_messages(self):
         """Open Messages"""
-        subprocess.Popen(['open', '-a', 'Messages'])
+        self._open_app('Messages')
         self.speak("Opening Messages")
     
     def open_calendar(self):
         """Open Calendar"""
-        subprocess.Popen(['open', '-a', 'Calendar'])
+        self._open_app('Calendar')
         self.speak("Opening Calendar")
     
     # ==================== WINDOW MANAGEMENT ====================
@@ -297,7 +554,7 @@ class VoiceController:
             end tell
         end tell
         '''
-        subprocess.run(['osascript', '-e', script])
+        self._run_applescript(script)
         self.speak("Maximizing")
     
     def fullscreen(self):
@@ -307,14 +564,12 @@ class VoiceController:
     
     def next_window(self):
         """Switch to next window (Cmd+`)"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to keystroke "`" using command down'])
+        self._send_key('`', ['command'])
         self.speak("Next window")
     
     def previous_window(self):
         """Switch to previous window (Cmd+Shift+`)"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to keystroke "`" using {command down, shift down}'])
+        self._send_key('`', ['command', 'shift'])
         self.speak("Previous window")
     
     def quit_app(self):
@@ -326,28 +581,22 @@ class VoiceController:
     
     def scroll_down(self):
         """Scroll down"""
-        for _ in range(3):
-            subprocess.run(['osascript', '-e', 
-                           'tell application "System Events" to key code 125'])  # Down arrow
+        self._send_key_code(self.KEY_DOWN_ARROW, repeat=3)
         self.speak("Scrolling down")
     
     def scroll_up(self):
         """Scroll up"""
-        for _ in range(3):
-            subprocess.run(['osascript', '-e', 
-                           'tell application "System Events" to key code 126'])  # Up arrow
+        self._send_key_code(self.KEY_UP_ARROW, repeat=3)
         self.speak("Scrolling up")
     
     def page_down(self):
         """Page down"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to key code 121'])  # Page Down
+        self._send_key_code(self.KEY_PAGE_DOWN)
         self.speak("Page down")
     
     def page_up(self):
         """Page up"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to key code 116'])  # Page Up
+        self._send_key_code(self.KEY_PAGE_UP)
         self.speak("Page up")
     
     def go_back(self):
@@ -369,14 +618,12 @@ class VoiceController:
     
     def next_tab(self):
         """Switch to next tab (Ctrl+Tab)"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to keystroke tab using {control down}'])
+        self._send_key('tab', ['control'])
         self.speak("Next tab")
     
     def previous_tab(self):
         """Switch to previous tab (Ctrl+Shift+Tab)"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to keystroke tab using {control down, shift down}'])
+        self._send_key('tab', ['control', 'shift'])
         self.speak("Previous tab")
     
     def reopen_tab(self):
@@ -388,34 +635,32 @@ class VoiceController:
     
     def volume_up(self):
         """Increase volume"""
-        subprocess.run(['osascript', '-e', 'set volume output volume ((output volume of (get volume settings)) + 10)'])
+        self._run_applescript('set volume output volume ((output volume of (get volume settings)) + 10)')
         self.speak("Volume up")
     
     def volume_down(self):
         """Decrease volume"""
-        subprocess.run(['osascript', '-e', 'set volume output volume ((output volume of (get volume settings)) - 10)'])
+        self._run_applescript('set volume output volume ((output volume of (get volume settings)) - 10)')
         self.speak("Volume down")
     
     def mute(self):
         """Mute volume"""
-        subprocess.run(['osascript', '-e', 'set volume output muted true'])
+        self._run_applescript('set volume output muted true')
         self.speak("Muted")
     
     def unmute(self):
         """Unmute volume"""
-        subprocess.run(['osascript', '-e', 'set volume output muted false'])
+        self._run_applescript('set volume output muted false')
         self.speak("Unmuted")
     
     def brightness_up(self):
         """Increase brightness"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to key code 144'])  # Brightness up key
+        self._send_key_code(self.KEY_BRIGHTNESS_UP)
         self.speak("Brightness up")
     
     def brightness_down(self):
         """Decrease brightness"""
-        subprocess.run(['osascript', '-e', 
-                       'tell application "System Events" to key code 145'])  # Brightness down key
+        self._send_key_code(self.KEY_BRIGHTNESS_DOWN)
         self.speak("Brightness down")
     
     def screenshot(self):
@@ -444,17 +689,69 @@ class VoiceController:
     
     def type_text(self, text):
         """
-        Type text using AppleScript
+        Type text, pasting it in one go when possible
         
         Args:
             text: Text to type
         """
+        if NSPasteboard is not None and Quartz is not None:
+            if self._paste_text(text):
+                return
+        
         # Escape quotes in text
         escaped_text = text.replace('"', '\\"').replace("'", "\\'")
         
         # Type using AppleScript
         script = f'tell application "System Events" to keystroke "{escaped_text}"'
-        subprocess.run(['osascript', '-e', script])
+        self._run_applescript(script, cache=False)
+    
+    def _paste_text(self, text):
+        """
+        Insert text with Cmd+V via the clipboard, restoring its text afterwards
+        
+        Returns:
+            bool: False if the clipboard holds anything but plain text (files,
+                  rich text, images), which a paste would destroy, so the
+                  caller should type instead
+        """
+        pasteboard = NSPasteboard.generalPasteboard()
+        with self._clipboard_lock:
+            pending = self._clipboard_restore is not None
+            if pending:
+                self._clipboard_restore.cancel()
+            if not pending or pasteboard.changeCount() != self._clipboard_change_count:
+                # Nothing of ours on the clipboard: save what the user has
+                if not set(pasteboard.types() or ()) <= self.PLAIN_TEXT_TYPES:
+                    self._clipboard_restore = None
+                    self._saved_clipboard = None
+                    return False
+                self._saved_clipboard = pasteboard.stringForType_(NSPasteboardTypeString)
+            
+            pasteboard.clearContents()
+            pasteboard.setString_forType_(text, NSPasteboardTypeString)
+            self._clipboard_change_count = pasteboard.changeCount()
+            self._post_key_code(self.KEY_CODES['v'], ['command'])
+            
+            # The target app reads the clipboard asynchronously; restore later
+            self._clipboard_restore = threading.Timer(0.5, self._restore_clipboard)
+            self._clipboard_restore.start()
+        return True
+    
+    def _restore_clipboard(self):
+        """Put back the clipboard text saved by _paste_text"""
+        with self._clipboard_lock:
+            # A newer paste replaced this timer (it fired before cancel())
+            if self._clipboard_restore is not threading.current_thread():
+                return
+            
+            pasteboard = NSPasteboard.generalPasteboard()
+            # Leave it alone if something else was copied in the meantime
+            if pasteboard.changeCount() == self._clipboard_change_count:
+                pasteboard.clearContents()
+                if self._saved_clipboard is not None:
+                    pasteboard.setString_forType_(self._saved_clipboard, NSPasteboardTypeString)
+            self._saved_clipboard = None
+            self._clipboard_restore = None
     
     # ==================== SEARCH ====================
     
@@ -463,19 +760,18 @@ class VoiceController:
         Search Google
         
         Args:
-            query: Search query (if None, will listen for it)
+            query: Search query (if None, the next utterance is used)
         """
         if query is None:
+            # The microphone belongs to the background listener, so run()
+            # hands over the next phrase if it arrives in time
+            with self._search_lock:
+                self._search_deadline = time.monotonic() + self.search_query_timeout
             self.speak("What do you want to search?")
-            query = self.listen(timeout=3, phrase_time_limit=5)
-            
-            if not query:
-                self.speak("No search query heard")
-                return
+            return
         
         # URL encode the query
-        import urllib.parse
-        encoded_query = urllib.parse.quote(query)
+        encoded_query = quote(query)
         
         # Open in browser
         url = f"https://www.google.com/search?q={encoded_query}"
@@ -485,21 +781,105 @@ class VoiceController:
     
     # ==================== HELPER METHODS ====================
     
+    def _open_app(self, app_name):
+        """
+        Launch (or bring forward) an application by name
+        
+        Args:
+            app_name: Application name as shown in /Applications
+        """
+        if NSWorkspace is not None:
+            if NSWorkspace.sharedWorkspace().launchApplication_(app_name):
+                return
+        subprocess.Popen(['open', '-a', app_name])
+    
+    def _run_applescript(self, script, cache=True):
+        """
+        Run an AppleScript snippet and wait for it to finish
+        
+        Runs in-process via NSAppleScript when pyobjc is available, so there
+        is no osascript process to spawn and each script is compiled once.
+        
+        Args:
+            script: AppleScript source
+            cache: Keep the compiled script for reuse (off for one-off text)
+        """
+        if NSAppleScript is None:
+            subprocess.run(['osascript', '-e', script])
+            return
+        
+        compiled = self._applescripts.get(script)
+        if compiled is None:
+            compiled = NSAppleScript.alloc().initWithSource_(script)
+            if cache:
+                self._applescripts[script] = compiled
+        
+        _, error = compiled.executeAndReturnError_(None)
+        if error is not None:
+            print(f"AppleScript error: {error.get('NSAppleScriptErrorMessage', error)}")
+    
     def _send_key(self, key, modifiers=None):
         """
-        Send keyboard shortcut using AppleScript
+        Send keyboard shortcut
+        
+        Posted directly as Quartz events when available; otherwise sent by
+        character through AppleScript, which also covers keys missing from
+        KEY_CODES.
         
         Args:
             key: Key to press
             modifiers: List of modifiers (command, shift, control, option)
         """
+        if Quartz is not None and key in self.KEY_CODES:
+            self._post_key_code(self.KEY_CODES[key], modifiers)
+            return
+        
+        key_str = 'tab' if key == 'tab' else f'"{key}"'
         if modifiers:
             mod_str = ', '.join([f'{m} down' for m in modifiers])
-            script = f'tell application "System Events" to keystroke "{key}" using {{{mod_str}}}'
+            script = f'tell application "System Events" to keystroke {key_str} using {{{mod_str}}}'
         else:
-            script = f'tell application "System Events" to keystroke "{key}"'
+            script = f'tell application "System Events" to keystroke {key_str}'
         
-        subprocess.run(['osascript', '-e', script])
+        self._run_applescript(script)
+    
+    def _send_key_code(self, key_code, modifiers=None, repeat=1):
+        """
+        Press a key by virtual key code
+        
+        Args:
+            key_code: Virtual key code (arrows, page keys, brightness...)
+            modifiers: List of modifiers (command, shift, control, option)
+            repeat: Number of presses
+        """
+        if Quartz is not None:
+            self._post_key_code(key_code, modifiers, repeat)
+            return
+        
+        using = ''
+        if modifiers:
+            using = ' using {' + ', '.join([f'{m} down' for m in modifiers]) + '}'
+        # All presses in one script
+        script = f'''
+        tell application "System Events"
+            repeat {repeat} times
+                key code {key_code}{using}
+            end repeat
+        end tell
+        '''
+        self._run_applescript(script)
+    
+    def _post_key_code(self, key_code, modifiers=None, repeat=1):
+        """Post key down/up Quartz events straight to the HID event tap"""
+        flags = 0
+        for modifier in modifiers or ():
+            flags |= self._modifier_flags[modifier]
+        
+        for _ in range(repeat):
+            for key_down in (True, False):
+                event = Quartz.CGEventCreateKeyboardEvent(None, key_code, key_down)
+                Quartz.CGEventSetFlags(event, flags)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
     
     def process_command(self, text):
         """
@@ -536,51 +916,100 @@ class VoiceController:
             self.search_google(query)
             return True
         
-        # Check for exact command matches
-        for command_phrase, command_function in self.commands.items():
-            if command_phrase in text:
-                try:
-                    command_function()
-                    self.command_count += 1
-                    self.last_command = command_phrase
-                    return True
-                except Exception as e:
-                    print(f"Error executing command '{command_phrase}': {e}")
-                    self.speak("Command failed")
-                    return False
+        # Exact utterance first, then the longest phrase contained in it
+        command_phrase = text if text in self.commands else None
+        if command_phrase is None:
+            command_phrase = next(
+                (phrase for phrase in self._command_phrases if phrase in text), None
+            )
+        if command_phrase is None:
+            command_phrase = self._fuzzy_match(text)
         
-        # No command found
-        print(f"Unknown command: '{text}'")
-        self.speak("Command not recognized")
-        return False
+        if command_phrase is None:
+            print(f"Unknown command: '{text}'")
+            self.speak("Command not recognized")
+            return False
+        
+        try:
+            self.commands[command_phrase]()
+            self.command_count += 1
+            self.last_command = command_phrase
+            return True
+        except Exception as e:
+            print(f"Error executing command '{command_phrase}': {e}")
+            self.speak("Command failed")
+            return False
     
-    def list_commands(self):
-        """Print all available commands"""
-        print("\nAvailable Commands:")
-        print("\nApplications:")
-        for cmd in ['open safari', 'open chrome', 'open notes', 'open terminal', 'open mail', 'open finder']:
-            print(f"  - {cmd}")
+    def _fuzzy_match(self, text):
+        """
+        Find the command phrase closest to a misheard utterance
         
-        print("\nWindow Management:")
-        for cmd in ['close window', 'new tab', 'minimize', 'maximize', 'quit app']:
-            print(f"  - {cmd}")
+        Args:
+            text: Normalized utterance that matched no phrase exactly
+            
+        Returns:
+            str: Closest command phrase, or None if none is close enough
+        """
+        if fuzzy_process is None:
+            return None
         
-        print("\n Navigation:")
-        for cmd in ['scroll down', 'scroll up', 'go back', 'go forward', 'refresh']:
-            print(f"  - {cmd}")
+        match = fuzzy_process.extractOne(text, self._command_phrases, scorer=fuzz.ratio)
+        if match is None or match[1] <= self.fuzzy_match_threshold:
+            return None
         
-        print("\n System:")
-        for cmd in ['volume up', 'volume down', 'mute', 'take screenshot']:
-            print(f"  - {cmd}")
+        print(f"Interpreting '{text}' as '{match[0]}'")
+        return match[0]
+    
+    def list_commands(self):
+        """Print all available commands"""
+        print(self._help_text)
+    
+    def _claim_search_query(self):
+        """
+        Take the pending search query slot if it is still open
         
-        print("\n Dictation:")
-        print("  - type / start typing (then speak to type)")
-        print("  - stop typing (to exit)")
+        Returns:
+            bool: True if the phrase just recorded is the search query
+        """
+        with self._search_lock:
+            if self._search_deadline is None or time.monotonic() > self._search_deadline:
+                return False
+            self._search_deadline = None
+            return True
+    
+    def _search_query_expired(self):
+        """
+        Close the search query slot once its deadline has passed
         
-        print("\n Search:")
-        print("  - search [query]")
-        print("  - google [query]")
-        print()
+        Returns:
+            bool: True if it just expired unanswered
+        """
+        with self._search_lock:
+            if self._search_deadline is None or time.monotonic() <= self._search_deadline:
+                return False
+            self._search_deadline = None
+            return True
+    
+    def _on_audio(self, recognizer, audio):
+        """Background listener callback: queue a recorded phrase"""
+        is_query = self._claim_search_query()
+        try:
+            self._audio_queue.put_nowait((audio, is_query))
+        except queue.Full:
+            print("Recognition is behind - phrase dropped")
+            if is_query:
+                self._text_queue.put((None, True))
+    
+    def _recognition_loop(self):
+        """Recognition thread: turn queued phrases into (text, is_query) for run()"""
+        while self.is_listening:
+            try:
+                audio, is_query = self._audio_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            text = self._transcribe(audio, free_form=is_query or self.dictation_mode)
+            if text or is_query:
+                self._text_queue.put((text, is_query))
     
     def run(self):
         """
@@ -594,10 +1023,33 @@ class VoiceController:
         self.is_listening = True
         self.speak("Voice controller activated")
         
+        # Capture keeps recording while the previous phrase is recognized
+        self._audio_queue = queue.Queue(maxsize=4)
+        self._text_queue = queue.Queue()
+        recognition_thread = threading.Thread(target=self._recognition_loop, daemon=True)
+        recognition_thread.start()
+        stop_capture = self.recognizer.listen_in_background(
+            self.microphone, self._on_audio, phrase_time_limit=5
+        )
+        print("🎤 Listening...")
+        
         try:
             while self.is_listening:
-                # Listen for command
-                text = self.listen()
+                if self._search_query_expired():
+                    self.speak("No search query heard")
+                
+                try:
+                    text, is_query = self._text_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                
+                if is_query:
+                    # Free text: not checked for exit/help or commands
+                    if text:
+                        self.search_google(text)
+                    else:
+                        self.speak("No search query heard")
+                    continue
                 
                 if text:
                     # Check for exit commands
@@ -613,14 +1065,12 @@ class VoiceController:
                     
                     # Process command
                     self.process_command(text)
-                
-                # Small delay
-                time.sleep(0.1)
         
         except KeyboardInterrupt:
             print("\nInterrupted by user")
         finally:
             self.is_listening = False
+            stop_capture(wait_for_stop=False)
             print("\nVoice Controller stopped")
             print(f"Total commands executed: {self.command_count}")
 
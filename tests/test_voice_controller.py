@@ -0,0 +1,57 @@
+"""
+Tests for VoiceController command matching
+"""
+
+import unittest
+
+try:
+    from modules.voice_controller import VoiceController
+except ImportError:  # speech_recognition / pyttsx3 not installed
+    VoiceController = None
+
+
+@unittest.skipIf(VoiceController is None, "voice controller dependencies not installed")
+class TestCommandMatching(unittest.TestCase):
+    """process_command picks the most specific phrase in an utterance"""
+
+    def setUp(self):
+        # Skip __init__: no microphone, TTS or AppleScript needed
+        self.controller = VoiceController.__new__(VoiceController)
+        self.called = []
+        self.controller.commands = {
+            phrase: (lambda name=name: self.called.append(name))
+            for phrase, name in [
+                ('mute', 'mute'),
+                ('unmute', 'unmute'),
+                ('quit app', 'quit_app'),
+                ('quit application', 'quit_app'),
+            ]
+        }
+        self.controller._index_commands()
+        self.controller.fuzzy_match_threshold = 80
+        self.controller.dictation_mode = False
+        self.controller.command_count = 0
+        self.controller.last_command = None
+        self.controller.speak = lambda text, blocking=False: None
+
+    def test_unmute_is_not_mute(self):
+        self.assertTrue(self.controller.process_command("unmute"))
+        self.assertEqual(self.called, ['unmute'])
+
+    def test_unmute_inside_sentence(self):
+        self.assertTrue(self.controller.process_command("please unmute the sound"))
+        self.assertEqual(self.called, ['unmute'])
+
+    def test_longest_phrase_wins(self):
+        # Contains both 'quit app' and 'quit application'
+        self.assertTrue(self.controller.process_command("please quit application now"))
+        self.assertEqual(self.called, ['quit_app'])
+        self.assertEqual(self.controller.last_command, 'quit application')
+
+    def test_unknown_command(self):
+        self.assertFalse(self.controller.process_command("what time is it"))
+        self.assertEqual(self.called, [])
+
+
+if __name__ == "__main__":
+    unittest.main()